@@ -136,6 +136,20 @@ class JupiterSwapAdapter(ExecutionPort):
         self._assert_pair_supported(pair, "base balance")
         return self.solana_sender.get_native_sol_balance_ui_amount()
 
+    def get_available_balances(self, pair: str) -> tuple[float, float]:
+        self._assert_pair_supported(pair, "balances")
+        balances_getter = getattr(self.solana_sender, "get_wallet_balances_ui_amount", None)
+        if callable(balances_getter):
+            try:
+                return balances_getter(USDC_MINT)
+            except Exception as error:
+                # Some RPC providers reject or limit batch requests; single calls work everywhere.
+                self.logger.warn("Batched balance RPC failed, falling back to single calls", {"error": str(error)})
+        return (
+            self.solana_sender.get_spl_token_balance_ui_amount(USDC_MINT),
+            self.solana_sender.get_native_sol_balance_ui_amount(),
+        )
+
     def _fetch_swap_transaction(self, quote_response: dict[str, Any]) -> str:
         payload = {
             "quoteResponse": quote_response,
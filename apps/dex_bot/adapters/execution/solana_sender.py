@@ -32,6 +32,13 @@ RETRIABLE_RPC_ERROR_MARKERS = (
     "service unavailable",
 )
 
+# Wallet files written before the KDF parameters were stored used these.
+LEGACY_SCRYPT_PARAMS = {"scrypt_n": 16384, "scrypt_r": 8, "scrypt_p": 1}
+# Upper bounds for KDF parameters read from the wallet file, so a corrupt
+# file cannot make startup allocate unbounded memory.
+MAX_SCRYPT_PARAMS = {"scrypt_n": 2**20, "scrypt_r": 16, "scrypt_p": 16}
+MAX_SCRYPT_MAXMEM = 2**31
+
 
 @dataclass
 class SignatureConfirmation:
@@ -58,16 +65,35 @@ def _parse_encrypted_wallet_file(path: str) -> dict[str, Any]:
         or not required_keys.issubset(parsed.keys())
     ):
         raise ValueError("Invalid encrypted wallet file format")
+    for name, default in LEGACY_SCRYPT_PARAMS.items():
+        value = parsed.setdefault(name, default)
+        if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+            raise ValueError(f"Invalid encrypted wallet file format: {name} must be a positive integer")
+        if value > MAX_SCRYPT_PARAMS[name]:
+            raise ValueError(f"Invalid encrypted wallet file format: {name} must be <= {MAX_SCRYPT_PARAMS[name]}")
+    n = parsed["scrypt_n"]
+    if n < 2 or n & (n - 1):
+        raise ValueError("Invalid encrypted wallet file format: scrypt_n must be a power of two greater than 1")
+    if _scrypt_maxmem(n, parsed["scrypt_r"], parsed["scrypt_p"]) > MAX_SCRYPT_MAXMEM:
+        raise ValueError(f"Invalid encrypted wallet file format: scrypt memory must be <= {MAX_SCRYPT_MAXMEM} bytes")
     return parsed
 
 
+def _scrypt_maxmem(n: int, r: int, p: int) -> int:
+    # OpenSSL needs 128 * r * (n + p + 2) bytes; hashlib's default cap is 32 MiB.
+    return 128 * r * (n + p + 2)
+
+
 def _decrypt_secret_key(path: str, passphrase: str) -> bytes:
     encrypted = _parse_encrypted_wallet_file(path)
     salt = base64.b64decode(encrypted["salt_base64"])
     iv = base64.b64decode(encrypted["iv_base64"])
     auth_tag = base64.b64decode(encrypted["auth_tag_base64"])
     ciphertext = base64.b64decode(encrypted["ciphertext_base64"])
-    key = scrypt(passphrase.encode("utf-8"), salt=salt, n=16384, r=8, p=1, dklen=32)
+    n = encrypted["scrypt_n"]
+    r = encrypted["scrypt_r"]
+    p = encrypted["scrypt_p"]
+    key = scrypt(passphrase.encode("utf-8"), salt=salt, n=n, r=r, p=p, maxmem=_scrypt_maxmem(n, r, p), dklen=32)
 
     aes_gcm = AESGCM(key)
     plaintext = aes_gcm.decrypt(iv, ciphertext + auth_tag, None)
@@ -96,6 +122,59 @@ def _is_retriable_rpc_error(error_obj: Any) -> bool:
     return any(marker in message for marker in RETRIABLE_RPC_ERROR_MARKERS)
 
 
+def _sum_token_accounts_ui_amount(result: Any) -> float:
+    if not isinstance(result, dict):
+        return 0.0
+    value = result.get("value")
+    if not isinstance(value, list):
+        return 0.0
+
+    total_ui_amount = 0.0
+    for account in value:
+        if not isinstance(account, dict):
+            continue
+        account_obj = account.get("account")
+        if not isinstance(account_obj, dict):
+            continue
+        data = account_obj.get("data")
+        if not isinstance(data, dict):
+            continue
+        parsed = data.get("parsed")
+        if not isinstance(parsed, dict):
+            continue
+        info = parsed.get("info")
+        if not isinstance(info, dict):
+            continue
+        token_amount = info.get("tokenAmount")
+        if not isinstance(token_amount, dict):
+            continue
+
+        ui_amount = token_amount.get("uiAmount")
+        if isinstance(ui_amount, (int, float)):
+            total_ui_amount += float(ui_amount)
+            continue
+
+        raw_amount = token_amount.get("amount")
+        decimals = token_amount.get("decimals")
+        if isinstance(raw_amount, str) and isinstance(decimals, int) and decimals >= 0:
+            try:
+                total_ui_amount += int(raw_amount) / (10**decimals)
+            except Exception:
+                continue
+
+    return total_ui_amount
+
+
+def _lamports_result_to_sol(result: Any) -> float:
+    if not isinstance(result, dict):
+        return 0.0
+    value = result.get("value")
+    if not isinstance(value, int) or value < 0:
+        return 0.0
+    lamports_per_sol = 1_000_000_000
+    return value / lamports_per_sol
+
+
 class SolanaSender:
     def __init__(self, rpc_url: str, wallet_key_path: str, wallet_passphrase: str, logger: LoggerPort):
         self.rpc_url = rpc_url
@@ -107,61 +186,24 @@ class SolanaSender:
 
     def get_spl_token_balance_ui_amount(self, mint: str) -> float:
         owner = self.get_public_key_base58()
-        result = self._rpc(
-            "getTokenAccountsByOwner",
-            [owner, {"mint": mint}, {"encoding": "jsonParsed"}],
+        return _sum_token_accounts_ui_amount(
+            self._rpc("getTokenAccountsByOwner", [owner, {"mint": mint}, {"encoding": "jsonParsed"}])
         )
-        if not isinstance(result, dict):
-            return 0.0
-        value = result.get("value")
-        if not isinstance(value, list):
-            return 0.0
-
-        total_ui_amount = 0.0
-        for account in value:
-            if not isinstance(account, dict):
-                continue
-            account_obj = account.get("account")
-            if not isinstance(account_obj, dict):
-                continue
-            data = account_obj.get("data")
-            if not isinstance(data, dict):
-                continue
-            parsed = data.get("parsed")
-            if not isinstance(parsed, dict):
-                continue
-            info = parsed.get("info")
-            if not isinstance(info, dict):
-                continue
-            token_amount = info.get("tokenAmount")
-            if not isinstance(token_amount, dict):
-                continue
-
-            ui_amount = token_amount.get("uiAmount")
-            if isinstance(ui_amount, (int, float)):
-                total_ui_amount += float(ui_amount)
-                continue
-
-            raw_amount = token_amount.get("amount")
-            decimals = token_amount.get("decimals")
-            if isinstance(raw_amount, str) and isinstance(decimals, int) and decimals >= 0:
-                try:
-                    total_ui_amount += int(raw_amount) / (10**decimals)
-                except Exception:
-                    continue
-
-        return total_ui_amount
 
     def get_native_sol_balance_ui_amount(self) -> float:
         owner = self.get_public_key_base58()
-        result = self._rpc("getBalance", [owner, {"commitment": "confirmed"}])
-        if not isinstance(result, dict):
-            return 0.0
-        value = result.get("value")
-        if not isinstance(value, int) or value < 0:
-            return 0.0
-        lamports_per_sol = 1_000_000_000
-        return value / lamports_per_sol
+        return _lamports_result_to_sol(self._rpc("getBalance", [owner, {"commitment": "confirmed"}]))
+
+    def get_wallet_balances_ui_amount(self, mint: str) -> tuple[float, float]:
+        """Return (token balance for ``mint``, native SOL) from one batched RPC round trip."""
+        owner = self.get_public_key_base58()
+        token_result, balance_result = self._rpc_batch(
+            [
+                ("getTokenAccountsByOwner", [owner, {"mint": mint}, {"encoding": "jsonParsed"}]),
+                ("getBalance", [owner, {"commitment": "confirmed"}]),
+            ]
+        )
+        return _sum_token_accounts_ui_amount(token_result), _lamports_result_to_sol(balance_result)
 
     def _rpc(
         self,
@@ -171,12 +213,30 @@ class SolanaSender:
         attempts: int | None = None,
         request_timeout_seconds: float | None = None,
     ) -> Any:
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": method,
-            "params": params,
-        }
+        return self._rpc_batch(
+            [(method, params)],
+            attempts=attempts,
+            request_timeout_seconds=request_timeout_seconds,
+        )[0]
+
+    def _rpc_batch(
+        self,
+        calls: list[tuple[str, list[Any]]],
+        *,
+        attempts: int | None = None,
+        request_timeout_seconds: float | None = None,
+    ) -> list[Any]:
+        """Send independent calls as one JSON-RPC batch and return results in call order.
+
+        A single call is sent as a plain request object. Any error reply fails
+        (or retries) the whole batch, the same as a failed single call.
+        """
+        requests_payload = [
+            {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+            for request_id, (method, params) in enumerate(calls, start=1)
+        ]
+        payload: Any = requests_payload[0] if len(requests_payload) == 1 else requests_payload
+        label = "+".join(method for method, _ in calls)
         total_attempts = max(1, int(attempts)) if attempts is not None else RPC_RETRY_ATTEMPTS
         timeout_seconds = request_timeout_seconds if request_timeout_seconds is not None else RPC_HTTP_TIMEOUT_SECONDS
         for attempt in range(1, total_attempts + 1):
@@ -186,7 +246,7 @@ class SolanaSender:
                 if attempt < total_attempts:
                     time.sleep(retry_delay_seconds(RPC_RETRY_BASE_DELAY_SECONDS, attempt))
                     continue
-                raise RuntimeError(f"RPC {method} failed: {error}") from error
+                raise RuntimeError(f"RPC {label} failed: {error}") from error
 
             if response.status_code != 200:
                 should_retry = (
@@ -203,18 +263,28 @@ class SolanaSender:
                 if attempt < total_attempts:
                     time.sleep(retry_delay_seconds(RPC_RETRY_BASE_DELAY_SECONDS, attempt))
                     continue
-                raise RuntimeError(f"RPC {method} returned invalid JSON: {error}") from error
-
-            if "error" in data:
-                rpc_error = data["error"]
+                raise RuntimeError(f"RPC {label} returned invalid JSON: {error}") from error
+
+            if isinstance(data, list):
+                # Batch replies may arrive in any order; match them back by id.
+                replies_by_id = {reply.get("id"): reply for reply in data if isinstance(reply, dict)}
+                replies = [
+                    replies_by_id.get(request["id"], {"error": f"missing response for id {request['id']}"})
+                    for request in requests_payload
+                ]
+            else:
+                replies = [data] * len(requests_payload)
+
+            rpc_error = next((reply["error"] for reply in replies if "error" in reply), None)
+            if rpc_error is not None:
                 if attempt < total_attempts and _is_retriable_rpc_error(rpc_error):
                     time.sleep(retry_delay_seconds(RPC_RETRY_BASE_DELAY_SECONDS, attempt))
                     continue
-                raise RuntimeError(f"RPC {method} failed: {rpc_error}")
+                raise RuntimeError(f"RPC {label} failed: {rpc_error}")
 
-            return data.get("result")
+            return [reply.get("result") for reply in replies]
 
-        raise RuntimeError(f"RPC {method} failed: retry attempts exhausted")
+        raise RuntimeError(f"RPC {label} failed: retry attempts exhausted")
 
     def send_versioned_transaction_base64(self, serialized_base64: str) -> str:
         tx_bytes = base64.b64decode(serialized_base64)
@@ -132,6 +132,10 @@ def close_position(
 
     def snapshot_balances() -> tuple[float, float] | None:
         try:
+            balances_getter = getattr(execution, "get_available_balances", None)
+            if callable(balances_getter):
+                quote, base = balances_getter(config["pair"])
+                return float(quote), float(base)
             quote = float(execution.get_available_quote_usdc(config["pair"]))
             base = float(execution.get_available_base_sol(config["pair"]))
             return quote, base
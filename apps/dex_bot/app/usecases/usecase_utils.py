@@ -27,6 +27,10 @@ SLIPPAGE_ERROR_MARKERS = (
     "exact out amount not matched",
 )
 SUMMARY_ERROR_MAX_LENGTH = 220
+_NESTED_MESSAGE_PATTERNS = (
+    re.compile(r"'message':\s*'([^']+)'"),
+    re.compile(r'"message"\s*:\s*"([^"]+)"'),
+)
 
 
 def now_iso() -> str:
@@ -71,8 +75,8 @@ def is_insufficient_funds_error_message(message: str) -> bool:
 
 def summarize_error_for_log(message: str, max_length: int = SUMMARY_ERROR_MAX_LENGTH) -> str:
     normalized = " ".join(message.strip().split())
-    for pattern in (r"'message':\s*'([^']+)'", r'"message"\s*:\s*"([^"]+)"'):
-        matched = re.search(pattern, normalized)
+    for pattern in _NESTED_MESSAGE_PATTERNS:
+        matched = pattern.search(normalized)
         if matched:
             normalized = matched.group(1).strip()
             break
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import math
 from datetime import UTC, datetime
+from itertools import islice
 from typing import Any
 
 from shared.indicators.ta import atr_series, ema_series, rsi_series
@@ -68,36 +69,26 @@ def _resolve_close_minutes(close_time: datetime) -> int:
     return resolved
 
 
-def _resolve_upper_bucket_index(close_time: datetime, timeframe_minutes: int) -> int:
-    close_minutes = _resolve_close_minutes(close_time)
-    return (close_minutes + timeframe_minutes - 1) // timeframe_minutes
-
-
 def _build_upper_timeframe_closes(bars: list[OhlcvBar], timeframe_minutes: int) -> list[float]:
     if not bars:
         return []
 
     upper_closes: list[float] = []
-    current_bucket_index: int | None = None
-    current_bucket_close: float | None = None
-
-    for bar in bars:
-        bucket_index = _resolve_upper_bucket_index(bar.close_time, timeframe_minutes)
-        if current_bucket_index is None:
-            current_bucket_index = bucket_index
-            current_bucket_close = bar.close
-            continue
+    # Bucket k covers close minutes in ((k - 1) * timeframe, k * timeframe].
+    first_close_minutes = _resolve_close_minutes(bars[0].close_time)
+    current_bucket_index = (first_close_minutes + timeframe_minutes - 1) // timeframe_minutes
+    current_bucket_close = bars[0].close
 
+    for bar in islice(bars, 1, None):
+        bucket_index = (_resolve_close_minutes(bar.close_time) + timeframe_minutes - 1) // timeframe_minutes
         if bucket_index != current_bucket_index:
-            if current_bucket_close is not None:
-                upper_closes.append(current_bucket_close)
+            upper_closes.append(current_bucket_close)
             current_bucket_index = bucket_index
-
         current_bucket_close = bar.close
 
     latest_close_minutes = _resolve_close_minutes(bars[-1].close_time)
     # Keep the last bucket only when the current bar is exactly on timeframe close.
-    if current_bucket_close is not None and latest_close_minutes % timeframe_minutes == 0:
+    if latest_close_minutes % timeframe_minutes == 0:
         upper_closes.append(current_bucket_close)
 
     return upper_closes
@@ -36,10 +36,8 @@ def build_ema_market_context(bars: list[OhlcvBar], strategy: StrategyConfig) ->
     ema_fast_series = ema_series(closes, strategy["ema_fast_period"])
     ema_slow_series = ema_series(closes, strategy["ema_slow_period"])
     ema_fast_offset = len(closes) - len(ema_fast_series)
-    ema_fast_by_bar: list[float | None] = []
-    for index, _close in enumerate(closes):
-        ema_index = index - ema_fast_offset
-        ema_fast_by_bar.append(ema_fast_series[ema_index] if ema_index >= 0 else None)
+    ema_fast_by_bar: list[float | None] = [None] * ema_fast_offset
+    ema_fast_by_bar.extend(ema_fast_series)
 
     ema_fast = ema_fast_by_bar[-1] if ema_fast_by_bar else None
     ema_slow = ema_slow_series[-1] if ema_slow_series else None
@@ -40,10 +40,11 @@ class FirestoreConfigRepository:
         return payload.get("broker") != GMO_BROKER
 
     def list_model_ids(self) -> list[str]:
-        model_docs = list(self.firestore.collection(MODELS_COLLECTION_ID).stream())
-        model_ids = [doc.id for doc in model_docs if self._is_supported_model_doc(doc.to_dict())]
-        model_ids.sort()
-        return model_ids
+        return sorted(
+            doc.id
+            for doc in self.firestore.collection(MODELS_COLLECTION_ID).stream()
+            if self._is_supported_model_doc(doc.to_dict())
+        )
 
     def is_global_pause_enabled(self) -> bool:
         control_snapshot = self.firestore.collection(GLOBAL_CONTROL_COLLECTION_ID).document(
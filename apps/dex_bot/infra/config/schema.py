@@ -1,21 +1,36 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 from apps.dex_bot.domain.model.types import BotConfig, StrategyConfig
 
-ALLOWED_TOP_LEVEL_KEYS = {
-    "enabled",
-    "network",
-    "pair",
-    "direction",
-    "signal_timeframe",
-    "strategy",
-    "risk",
-    "execution",
-    "exit",
-    "meta",
-}
+ALLOWED_TOP_LEVEL_KEYS = frozenset(
+    {
+        "enabled",
+        "network",
+        "pair",
+        "direction",
+        "signal_timeframe",
+        "strategy",
+        "risk",
+        "execution",
+        "exit",
+        "meta",
+    }
+)
+
+STRATEGY_NAMES = frozenset(
+    {
+        "ema_trend_pullback_v0",
+        "ema_trend_pullback_15m_v0",
+        "ema_trend_pullback_15m_v2",
+        "supertrend_15m_v0",
+        "donchian_breakout_15m_v0",
+        "mean_reversion_15m_v0",
+        "storm_short_v0",
+    }
+)
 
 DEFAULT_VOLATILE_ATR_PCT_THRESHOLD = 1.30
 DEFAULT_STORM_ATR_PCT_THRESHOLD = 1.40
@@ -56,25 +71,18 @@ STRATEGY_OPTIONAL_RSI_BOUND_FIELDS = frozenset(
 )
 
 
-def _require(condition: bool, message: str) -> None:
+def _require(condition: bool, message: str | Callable[[], str]) -> None:
+    # Interpolated messages are passed as a callable so they are only formatted
+    # when validation actually fails.
     if not condition:
-        raise ValueError(message)
+        raise ValueError(message() if callable(message) else message)
 
 
 def _parse_strategy(strategy: Any, prefix: str) -> StrategyConfig:
-    _require(isinstance(strategy, dict), f"{prefix} must be object")
+    _require(isinstance(strategy, dict), lambda: f"{prefix} must be object")
     _require(
-        strategy.get("name")
-        in (
-            "ema_trend_pullback_v0",
-            "ema_trend_pullback_15m_v0",
-            "ema_trend_pullback_15m_v2",
-            "supertrend_15m_v0",
-            "donchian_breakout_15m_v0",
-            "mean_reversion_15m_v0",
-            "storm_short_v0",
-        ),
-        (
+        strategy.get("name") in STRATEGY_NAMES,
+        lambda: (
             f"{prefix}.name must be ema_trend_pullback_v0, ema_trend_pullback_15m_v0, "
             "ema_trend_pullback_15m_v2, supertrend_15m_v0, donchian_breakout_15m_v0, "
             "mean_reversion_15m_v0 or storm_short_v0"
@@ -82,18 +90,18 @@ def _parse_strategy(strategy: Any, prefix: str) -> StrategyConfig:
     )
     _require(
         isinstance(strategy.get("ema_fast_period"), int) and strategy["ema_fast_period"] > 0,
-        f"{prefix}.ema_fast_period must be positive int",
+        lambda: f"{prefix}.ema_fast_period must be positive int",
     )
     _require(
         isinstance(strategy.get("ema_slow_period"), int) and strategy["ema_slow_period"] > 0,
-        f"{prefix}.ema_slow_period must be positive int",
+        lambda: f"{prefix}.ema_slow_period must be positive int",
     )
     _require(
         isinstance(strategy.get("swing_low_lookback_bars"), int)
         and strategy["swing_low_lookback_bars"] > 0,
-        f"{prefix}.swing_low_lookback_bars must be positive int",
+        lambda: f"{prefix}.swing_low_lookback_bars must be positive int",
     )
-    _require(strategy.get("entry") == "ON_BAR_CLOSE", f"{prefix}.entry must be ON_BAR_CLOSE")
+    _require(strategy.get("entry") == "ON_BAR_CLOSE", lambda: f"{prefix}.entry must be ON_BAR_CLOSE")
 
     parsed: StrategyConfig = {
         "name": strategy["name"],
@@ -109,7 +117,7 @@ def _parse_strategy(strategy: Any, prefix: str) -> StrategyConfig:
         value = strategy[key]
         _require(
             isinstance(value, int) and not isinstance(value, bool) and value >= minimum,
-            f"{prefix}.{key} must be int >= {minimum}",
+            lambda: f"{prefix}.{key} must be int >= {minimum}",
         )
         parsed[key] = value  # type: ignore[literal-required]
 
@@ -119,7 +127,7 @@ def _parse_strategy(strategy: Any, prefix: str) -> StrategyConfig:
         value = strategy[key]
         _require(
             isinstance(value, (int, float)) and not isinstance(value, bool) and float(value) >= minimum,
-            f"{prefix}.{key} must be number >= {minimum}",
+            lambda: f"{prefix}.{key} must be number >= {minimum}",
         )
         parsed[key] = float(value)  # type: ignore[literal-required]
 
@@ -129,7 +137,7 @@ def _parse_strategy(strategy: Any, prefix: str) -> StrategyConfig:
         value = strategy[key]
         _require(
             isinstance(value, (int, float)) and not isinstance(value, bool) and 0 <= float(value) <= 100,
-            f"{prefix}.{key} must be number between 0 and 100",
+            lambda: f"{prefix}.{key} must be number between 0 and 100",
         )
         parsed[key] = float(value)  # type: ignore[literal-required]
 
@@ -140,7 +148,7 @@ def _parse_strategy(strategy: Any, prefix: str) -> StrategyConfig:
         components = strategy["components"]
         _require(
             isinstance(components, dict),
-            f"{prefix}.components must be an object when present",
+            lambda: f"{prefix}.components must be an object when present",
         )
         parsed["components"] = components  # type: ignore[literal-required]
 
@@ -148,15 +156,15 @@ def _parse_strategy(strategy: Any, prefix: str) -> StrategyConfig:
 
 
 def _parse_risk(risk: Any, prefix: str) -> dict[str, float | int]:
-    _require(isinstance(risk, dict), f"{prefix} must be object")
+    _require(isinstance(risk, dict), lambda: f"{prefix} must be object")
     _require(
         isinstance(risk.get("max_loss_per_trade_pct"), (int, float))
         and risk["max_loss_per_trade_pct"] > 0,
-        f"{prefix}.max_loss_per_trade_pct must be positive",
+        lambda: f"{prefix}.max_loss_per_trade_pct must be positive",
     )
     _require(
         isinstance(risk.get("max_trades_per_day"), int) and risk["max_trades_per_day"] > 0,
-        f"{prefix}.max_trades_per_day must be positive int",
+        lambda: f"{prefix}.max_trades_per_day must be positive int",
     )
     volatile_atr_pct_threshold = risk.get(
         "volatile_atr_pct_threshold", DEFAULT_VOLATILE_ATR_PCT_THRESHOLD
@@ -166,27 +174,27 @@ def _parse_risk(risk: Any, prefix: str) -> dict[str, float | int]:
     storm_size_multiplier = risk.get("storm_size_multiplier", DEFAULT_STORM_SIZE_MULTIPLIER)
     _require(
         isinstance(volatile_atr_pct_threshold, (int, float)) and volatile_atr_pct_threshold > 0,
-        f"{prefix}.volatile_atr_pct_threshold must be positive",
+        lambda: f"{prefix}.volatile_atr_pct_threshold must be positive",
     )
     _require(
         isinstance(storm_atr_pct_threshold, (int, float)) and storm_atr_pct_threshold > 0,
-        f"{prefix}.storm_atr_pct_threshold must be positive",
+        lambda: f"{prefix}.storm_atr_pct_threshold must be positive",
     )
     _require(
         storm_atr_pct_threshold >= volatile_atr_pct_threshold,
-        f"{prefix}.storm_atr_pct_threshold must be >= {prefix}.volatile_atr_pct_threshold",
+        lambda: f"{prefix}.storm_atr_pct_threshold must be >= {prefix}.volatile_atr_pct_threshold",
     )
     _require(
         isinstance(volatile_size_multiplier, (int, float)) and 0 < volatile_size_multiplier <= 1,
-        f"{prefix}.volatile_size_multiplier must be > 0 and <= 1",
+        lambda: f"{prefix}.volatile_size_multiplier must be > 0 and <= 1",
     )
     _require(
         isinstance(storm_size_multiplier, (int, float)) and 0 <= storm_size_multiplier <= 1,
-        f"{prefix}.storm_size_multiplier must be >= 0 and <= 1",
+        lambda: f"{prefix}.storm_size_multiplier must be >= 0 and <= 1",
     )
     _require(
         storm_size_multiplier <= volatile_size_multiplier,
-        f"{prefix}.storm_size_multiplier must be <= {prefix}.volatile_size_multiplier",
+        lambda: f"{prefix}.storm_size_multiplier must be <= {prefix}.volatile_size_multiplier",
     )
     return {
         "max_loss_per_trade_pct": float(risk["max_loss_per_trade_pct"]),
@@ -199,12 +207,12 @@ def _parse_risk(risk: Any, prefix: str) -> dict[str, float | int]:
 
 
 def _parse_exit(exit_config: Any, prefix: str) -> dict[str, str | float]:
-    _require(isinstance(exit_config, dict), f"{prefix} must be object")
-    _require(exit_config.get("stop") == "SWING_LOW", f"{prefix}.stop must be SWING_LOW")
+    _require(isinstance(exit_config, dict), lambda: f"{prefix} must be object")
+    _require(exit_config.get("stop") == "SWING_LOW", lambda: f"{prefix}.stop must be SWING_LOW")
     _require(
         isinstance(exit_config.get("take_profit_r_multiple"), (int, float))
         and exit_config["take_profit_r_multiple"] > 0,
-        f"{prefix}.take_profit_r_multiple must be positive",
+        lambda: f"{prefix}.take_profit_r_multiple must be positive",
     )
     return {
         "stop": exit_config["stop"],
@@ -214,8 +222,8 @@ def _parse_exit(exit_config: Any, prefix: str) -> dict[str, str | float]:
 
 def parse_config(data: Any) -> BotConfig:
     _require(isinstance(data, dict), "config/current must be an object")
-    unknown_keys = set(data.keys()) - ALLOWED_TOP_LEVEL_KEYS
-    _require(not unknown_keys, f"config/current has unknown keys: {sorted(unknown_keys)}")
+    unknown_keys = [key for key in data if key not in ALLOWED_TOP_LEVEL_KEYS]
+    _require(not unknown_keys, lambda: f"config/current has unknown keys: {sorted(unknown_keys)}")
 
     _require(isinstance(data.get("enabled"), bool), "enabled must be boolean")
     _require(data.get("network") == "mainnet-beta", "network must be 'mainnet-beta'")
@@ -235,7 +243,7 @@ def parse_config(data: Any) -> BotConfig:
     ):
         _require(
             data["signal_timeframe"] == "15m",
-            f"{strategy['name']} requires signal_timeframe='15m'",
+            lambda: f"{strategy['name']} requires signal_timeframe='15m'",
         )
     if strategy["name"] == "ema_trend_pullback_v0":
         _require(
@@ -1,20 +1,106 @@
 from __future__ import annotations
 
+import atexit
 import json
-from datetime import UTC, datetime
+import queue
+import sys
+import threading
+import time
 from typing import Any
 
 from apps.dex_bot.app.ports.logger_port import LoggerPort
 
 
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the last formatted second. Only the
+# millisecond suffix changes between log lines within the same second.
+_cached_second: tuple[int, str] = (-1, "")
+
+# json.dumps builds a fresh JSONEncoder whenever a non-default option such as
+# ensure_ascii=False is passed, so keep one encoder for every log line.
+_encode_json = json.JSONEncoder(ensure_ascii=False).encode
+
+
 def _now_iso_utc() -> str:
-    return datetime.now(tz=UTC).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+    global _cached_second
+    second, millis = divmod(int(time.time() * 1000), 1000)
+    cached = _cached_second
+    if cached[0] != second:
+        cached = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+        _cached_second = cached
+    return f"{cached[1]}.{millis:03d}Z"
 
 
 def _format_context(context: dict[str, Any] | None = None) -> str:
     if context is None or len(context) == 0:
         return ""
-    return f" {json.dumps(context, ensure_ascii=False)}"
+    return f" {_encode_json(context)}"
+
+
+class _BackgroundLineWriter:
+    """Writes log lines to stdout from a daemon thread.
+
+    Callers only enqueue the formatted line, so a slow or blocked stdout never
+    stalls the trading cycle. stdout is flushed whenever the queue drains.
+    """
+
+    _STOP = object()
+
+    def __init__(self) -> None:
+        self._queue: queue.SimpleQueue[object] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+
+    def write(self, line: str) -> None:
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            with self._thread_lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+                    self._thread.start()
+        self._queue.put(line)
+
+    def close(self, timeout: float = 5.0) -> None:
+        with self._thread_lock:
+            thread = self._thread
+            if thread is None or not thread.is_alive():
+                return
+            self._queue.put(self._STOP)
+            thread.join(timeout=timeout)
+            if thread.is_alive():
+                return
+            # Lines enqueued after the stop marker would otherwise wait for the
+            # next write to restart the thread.
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not self._STOP:
+                    sys.stdout.write(item)  # type: ignore[arg-type]
+            sys.stdout.flush()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                sys.stdout.flush()
+                return
+            sys.stdout.write(item)  # type: ignore[arg-type]
+            if self._queue.empty():
+                sys.stdout.flush()
+
+
+_line_writer = _BackgroundLineWriter()
+atexit.register(_line_writer.close)
+
+
+def _write_line(line: str) -> None:
+    _line_writer.write(line + "\n")
+
+
+def close_log_writer() -> None:
+    """Drain queued log lines to stdout and stop the writer thread."""
+    _line_writer.close()
 
 
 class ConsoleLogger(LoggerPort):
@@ -22,13 +108,13 @@ class ConsoleLogger(LoggerPort):
         self.component = component
 
     def info(self, message: str, context: dict[str, Any] | None = None) -> None:
-        print(f"{_now_iso_utc()} [INFO] [{self.component}] {message}{_format_context(context)}", flush=True)
+        _write_line(f"{_now_iso_utc()} [INFO] [{self.component}] {message}{_format_context(context)}")
 
     def warn(self, message: str, context: dict[str, Any] | None = None) -> None:
-        print(f"{_now_iso_utc()} [WARN] [{self.component}] {message}{_format_context(context)}", flush=True)
+        _write_line(f"{_now_iso_utc()} [WARN] [{self.component}] {message}{_format_context(context)}")
 
     def error(self, message: str, context: dict[str, Any] | None = None) -> None:
-        print(f"{_now_iso_utc()} [ERROR] [{self.component}] {message}{_format_context(context)}", flush=True)
+        _write_line(f"{_now_iso_utc()} [ERROR] [{self.component}] {message}{_format_context(context)}")
 
 
 def create_logger(component: str = "bot") -> LoggerPort:
@@ -1,32 +1,40 @@
 from __future__ import annotations
 
 import signal
-import sys
 import threading
 from pathlib import Path
 
 from dotenv import load_dotenv
 
 from apps.dex_bot.infra.bootstrap import bootstrap
-from apps.dex_bot.infra.logging.logger import create_logger
+from apps.dex_bot.infra.logging.logger import close_log_writer, create_logger
+
+
+# The handler only records the signal and wakes the main thread; logging and
+# runtime.stop() run after stop_event.wait() returns, outside signal context.
+_stop_event = threading.Event()
+_received_signal: int | None = None
+
+
+def _on_signal(signum: int, _frame: object) -> None:
+    global _received_signal
+    _received_signal = signum
+    _stop_event.set()
 
 
 def main() -> int:
     load_dotenv(dotenv_path=Path(".env"))
     logger = create_logger("bot")
     runtime = bootstrap()
-    stop_event = threading.Event()
-
-    def shutdown(sig_name: str) -> None:
-        logger.info("received shutdown signal", {"signal": sig_name})
-        runtime.stop()
-        stop_event.set()
 
-    signal.signal(signal.SIGINT, lambda _signum, _frame: shutdown("SIGINT"))
-    signal.signal(signal.SIGTERM, lambda _signum, _frame: shutdown("SIGTERM"))
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, _on_signal)
 
     runtime.start()
-    stop_event.wait()
+    _stop_event.wait()
+    logger.info("received shutdown signal", {"signal": signal.Signals(_received_signal).name})
+    runtime.stop()
+    close_log_writer()
     return 0
 
 
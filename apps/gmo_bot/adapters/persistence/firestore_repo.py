@@ -26,14 +26,19 @@ def sanitize_firestore_value(value: Any) -> Any:
     at the call site when a persisted field must be deleted.
     """
 
+    # Scalars are returned as-is, so only containers are recursed into; this
+    # keeps the per-field cost of flat trade payloads to a type check.
     if isinstance(value, list):
-        return [sanitize_firestore_value(item) for item in value]
+        return [
+            sanitize_firestore_value(item) if isinstance(item, (dict, list)) else item
+            for item in value
+        ]
     if isinstance(value, dict):
-        sanitized: dict[str, Any] = {}
-        for key, nested_value in value.items():
-            if nested_value is not None:
-                sanitized[key] = sanitize_firestore_value(nested_value)
-        return sanitized
+        return {
+            key: sanitize_firestore_value(nested_value) if isinstance(nested_value, (dict, list)) else nested_value
+            for key, nested_value in value.items()
+            if nested_value is not None
+        }
     return value
 
 
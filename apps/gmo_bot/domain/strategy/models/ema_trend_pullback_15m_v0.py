@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import math
 from datetime import UTC, datetime
+from itertools import islice
 from typing import Any
 
 from shared.indicators.ta import atr_series, ema_series, rsi_series
@@ -87,48 +88,36 @@ def _resolve_close_minutes(close_time: datetime) -> int:
     return resolved
 
 
-def _resolve_upper_bucket_index(close_time: datetime, timeframe_minutes: int) -> int:
-    close_minutes = _resolve_close_minutes(close_time)
-    return (close_minutes + timeframe_minutes - 1) // timeframe_minutes
-
-
 def _build_upper_timeframe_closes(bars: list[OhlcvBar], timeframe_minutes: int) -> list[float]:
     if not bars:
         return []
 
     upper_closes: list[float] = []
-    current_bucket_index: int | None = None
-    current_bucket_close: float | None = None
-
-    for bar in bars:
-        bucket_index = _resolve_upper_bucket_index(bar.close_time, timeframe_minutes)
-        if current_bucket_index is None:
-            current_bucket_index = bucket_index
-            current_bucket_close = bar.close
-            continue
+    # Bucket k covers close minutes in ((k - 1) * timeframe, k * timeframe].
+    first_close_minutes = _resolve_close_minutes(bars[0].close_time)
+    current_bucket_index = (first_close_minutes + timeframe_minutes - 1) // timeframe_minutes
+    current_bucket_close = bars[0].close
 
+    for bar in islice(bars, 1, None):
+        bucket_index = (_resolve_close_minutes(bar.close_time) + timeframe_minutes - 1) // timeframe_minutes
         if bucket_index != current_bucket_index:
-            if current_bucket_close is not None:
-                upper_closes.append(current_bucket_close)
+            upper_closes.append(current_bucket_close)
             current_bucket_index = bucket_index
-
         current_bucket_close = bar.close
 
     latest_close_minutes = _resolve_close_minutes(bars[-1].close_time)
     # Keep the last bucket only when the current bar is exactly on timeframe close.
-    if current_bucket_close is not None and latest_close_minutes % timeframe_minutes == 0:
+    if latest_close_minutes % timeframe_minutes == 0:
         upper_closes.append(current_bucket_close)
 
     return upper_closes
 
 
 def _evaluate_upper_timeframe_trend(
-    bars: list[OhlcvBar],
-    timeframe_minutes: int = UPPER_TREND_TIMEFRAME_MINUTES,
+    upper_closes: list[float],
     ema_fast_period: int = UPPER_TREND_EMA_FAST_PERIOD,
     ema_slow_period: int = UPPER_TREND_EMA_SLOW_PERIOD,
 ) -> tuple[str, float | None, float | None, int]:
-    upper_closes = _build_upper_timeframe_closes(bars, timeframe_minutes)
     upper_ema_fast_values = ema_series(upper_closes, ema_fast_period)
     upper_ema_slow_values = ema_series(upper_closes, ema_slow_period)
     upper_ema_fast = upper_ema_fast_values[-1] if upper_ema_fast_values else None
@@ -184,11 +173,9 @@ def _calculate_pct_change(current: float | None, previous: float | None) -> floa
 
 
 def _calculate_upper_trend_regime_metrics(
-    bars: list[OhlcvBar],
-    timeframe_minutes: int = UPPER_TREND_TIMEFRAME_MINUTES,
+    upper_closes: list[float],
     ema_fast_period: int = UPPER_TREND_EMA_FAST_PERIOD,
 ) -> tuple[float | None, float | None]:
-    upper_closes = _build_upper_timeframe_closes(bars, timeframe_minutes)
     upper_ema_fast_values = ema_series(upper_closes, ema_fast_period)
     upper_fast_slope_pct = None
     if len(upper_ema_fast_values) >= 2:
@@ -354,9 +341,10 @@ def evaluate_ema_trend_pullback_15m_v0(
             diagnostics=diagnostics,
         )
 
+    # Built once here; both the trend state and the regime metrics read it.
+    upper_closes = _build_upper_timeframe_closes(bars, upper_trend_timeframe_minutes)
     upper_trend_state, upper_ema_fast, upper_ema_slow, upper_bars_count = _evaluate_upper_timeframe_trend(
-        bars,
-        upper_trend_timeframe_minutes,
+        upper_closes,
         upper_trend_ema_fast_period,
         upper_trend_ema_slow_period,
     )
@@ -367,8 +355,7 @@ def evaluate_ema_trend_pullback_15m_v0(
     diagnostics["upper_trend_state"] = upper_trend_state
     upper_trend_gap_pct = _calculate_ema_gap_pct(upper_ema_fast, upper_ema_slow)
     upper_fast_slope_pct, upper_close_drift_pct_3 = _calculate_upper_trend_regime_metrics(
-        bars,
-        upper_trend_timeframe_minutes,
+        upper_closes,
         upper_trend_ema_fast_period,
     )
     diagnostics["upper_trend_gap_pct"] = upper_trend_gap_pct
@@ -408,8 +395,7 @@ def evaluate_ema_trend_pullback_15m_v0(
     ):
         weak_trend_state_2h, weak_trend_ema_fast_2h, weak_trend_ema_slow_2h, weak_trend_bars_count_2h = (
             _evaluate_upper_timeframe_trend(
-                bars,
-                long_weak_trend_confirm_timeframe_minutes,
+                _build_upper_timeframe_closes(bars, long_weak_trend_confirm_timeframe_minutes),
                 upper_trend_ema_fast_period,
                 upper_trend_ema_slow_period,
             )
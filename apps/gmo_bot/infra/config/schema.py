@@ -17,24 +17,26 @@ MAX_LOSS_PER_TRADE_PCT_UPPER_BOUND = 50.0
 MIN_LOSS_PER_TRADE_PCT_LOWER_BOUND = 0.01
 GMO_SOL_JPY_MIN_NOTIONAL_JPY_HINT = 100.0
 
-ALLOWED_TOP_LEVEL_KEYS = {
-    "enabled",
-    "broker",
-    "pair",
-    "direction",
-    "signal_timeframe",
-    "strategy",
-    "risk",
-    "execution",
-    "exit",
-    "meta",
-}
+ALLOWED_TOP_LEVEL_KEYS = frozenset(
+    {
+        "enabled",
+        "broker",
+        "pair",
+        "direction",
+        "signal_timeframe",
+        "strategy",
+        "risk",
+        "execution",
+        "exit",
+        "meta",
+    }
+)
 
 
 def parse_config(data: Any) -> BotConfig:
     _require(isinstance(data, dict), "config/current must be an object")
-    unknown_keys = set(data.keys()) - ALLOWED_TOP_LEVEL_KEYS
-    _require(not unknown_keys, f"config/current has unknown keys: {sorted(unknown_keys)}")
+    unknown_keys = [key for key in data if key not in ALLOWED_TOP_LEVEL_KEYS]
+    _require(not unknown_keys, lambda: f"config/current has unknown keys: {sorted(unknown_keys)}")
 
     _require(isinstance(data.get("enabled"), bool), "enabled must be boolean")
     _require(data.get("broker") == "GMO_COIN", "broker must be 'GMO_COIN'")
@@ -58,7 +60,7 @@ def parse_config(data: Any) -> BotConfig:
     ):
         _require(
             data["signal_timeframe"] in ("15m", "1h", "4h"),
-            f"{strategy['name']} requires signal_timeframe in ('15m','1h','4h')",
+            lambda: f"{strategy['name']} requires signal_timeframe in ('15m','1h','4h')",
         )
     if strategy["name"] == "ema_trend_pullback_v0":
         _require(
@@ -92,7 +94,7 @@ def parse_config(data: Any) -> BotConfig:
     )
     _require(
         float(execution["min_notional_jpy"]) >= GMO_SOL_JPY_MIN_NOTIONAL_JPY_HINT,
-        f"execution.min_notional_jpy must be >= {GMO_SOL_JPY_MIN_NOTIONAL_JPY_HINT} JPY (GMO SOL/JPY minimum)",
+        lambda: f"execution.min_notional_jpy must be >= {GMO_SOL_JPY_MIN_NOTIONAL_JPY_HINT} JPY (GMO SOL/JPY minimum)",
     )
     leverage_multiplier = execution.get("leverage_multiplier", 1.0)
     margin_usage_ratio = execution.get("margin_usage_ratio", 0.99)
@@ -111,13 +113,13 @@ def parse_config(data: Any) -> BotConfig:
     if isinstance(take_profit_r, (int, float)):
         _require(
             0 < float(take_profit_r) <= MAX_TAKE_PROFIT_R_MULTIPLE,
-            f"exit.take_profit_r_multiple must be in (0, {MAX_TAKE_PROFIT_R_MULTIPLE}]",
+            lambda: f"exit.take_profit_r_multiple must be in (0, {MAX_TAKE_PROFIT_R_MULTIPLE}]",
         )
     max_loss_pct = risk.get("max_loss_per_trade_pct") if isinstance(risk, dict) else None
     if isinstance(max_loss_pct, (int, float)):
         _require(
             MIN_LOSS_PER_TRADE_PCT_LOWER_BOUND <= float(max_loss_pct) <= MAX_LOSS_PER_TRADE_PCT_UPPER_BOUND,
-            f"risk.max_loss_per_trade_pct must be in [{MIN_LOSS_PER_TRADE_PCT_LOWER_BOUND}, {MAX_LOSS_PER_TRADE_PCT_UPPER_BOUND}]",
+            lambda: f"risk.max_loss_per_trade_pct must be in [{MIN_LOSS_PER_TRADE_PCT_LOWER_BOUND}, {MAX_LOSS_PER_TRADE_PCT_UPPER_BOUND}]",
         )
 
     meta = data.get("meta")
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
+import math
 import random
 import threading
 import time
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
 from typing import Callable
 
 from apps.gmo_bot.app.ports.logger_port import LoggerPort
@@ -21,10 +21,10 @@ class CronController:
     stop: Callable[[], None]
 
 
-def _seconds_until_next_minute() -> float:
-    now = datetime.now(tz=UTC)
-    next_minute = (now.replace(second=0, microsecond=0) + timedelta(minutes=1))
-    return max((next_minute - now).total_seconds(), 0.0)
+def _next_minute_boundary(now: float) -> float:
+    # Epoch seconds are UTC-aligned, so the next whole multiple of 60 is the
+    # next UTC minute boundary.
+    return float(math.floor(now / 60) * 60 + 60)
 
 
 def create_cron_cycle(task: Callable[[], None], logger: LoggerPort) -> CronController:
@@ -33,14 +33,21 @@ def create_cron_cycle(task: Callable[[], None], logger: LoggerPort) -> CronContr
     thread: threading.Thread | None = None
 
     def _runner() -> None:
+        next_run_at = _next_minute_boundary(time.time())
         while not stop_event.is_set():
-            wait_seconds = _seconds_until_next_minute() + random.uniform(0, _CRON_JITTER_MAX_SECONDS)
+            wait_seconds = max(next_run_at - time.time(), 0.0) + random.uniform(0, _CRON_JITTER_MAX_SECONDS)
             if stop_event.wait(wait_seconds):
                 break
             try:
                 task()
             except Exception as error:
                 logger.error("cron task failed", {"error": str(error)})
+            next_run_at += 60.0
+            now = time.time()
+            if next_run_at <= now:
+                # The task overran one or more ticks; skip them rather than
+                # firing back-to-back catch-up runs.
+                next_run_at = _next_minute_boundary(now)
 
     def start() -> None:
         nonlocal thread
@@ -35,7 +35,7 @@ from apps.gmo_bot.domain.strategy.models.ema_trend_pullback_15m_v0 import (
     _build_upper_timeframe_closes,
     _calculate_ema_gap_pct,
 )
-from research.src.adapters.csv_bar_repository import read_bars_from_csv, write_json
+from research.src.adapters.csv_bar_repository import read_bars, write_json
 from research.src.domain.backtest_engine import (
     _evaluate_strategy_for_backtest,
     _resolve_effective_notional,
@@ -84,7 +84,7 @@ class ReplayedTrade:
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Analyze losing-trade regime characteristics for GMO 15m model")
     parser.add_argument("--config", default=DEFAULT_CONFIG, help="JSON config file path")
-    parser.add_argument("--bars", default=DEFAULT_BARS, help="OHLCV CSV file path")
+    parser.add_argument("--bars", default=DEFAULT_BARS, help="OHLCV .parquet or .csv file path")
     parser.add_argument("--late-cutoff", default=DEFAULT_LATE_CUTOFF, help="ISO timestamp separating late regime")
     parser.add_argument("--output", default=None, help="optional output report JSON path")
     return parser.parse_args()
@@ -435,7 +435,7 @@ def _bucket_report(
 def main() -> None:
     args = parse_args()
     config = load_bot_config(args.config)
-    bars = read_bars_from_csv(args.bars)
+    bars = read_bars(args.bars)
     trades = _replay_trades(config, bars)
 
     late_trades = [trade for trade in trades if trade.entry_time >= args.late_cutoff]
@@ -12,7 +12,7 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from research.src.adapters.csv_bar_repository import read_bars_from_csv, write_json
+from research.src.adapters.csv_bar_repository import read_bars, write_json
 from research.src.domain.backtest_engine import run_backtest
 from research.src.infra.research_config import load_bot_config
 
@@ -32,7 +32,7 @@ class SweepCase:
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Analyze GMO 15m parameter sensitivity on offline backtest")
     parser.add_argument("--config", default=DEFAULT_CONFIG, help="JSON config file path")
-    parser.add_argument("--bars", default=DEFAULT_BARS, help="OHLCV CSV file path")
+    parser.add_argument("--bars", default=DEFAULT_BARS, help="OHLCV .parquet or .csv file path")
     parser.add_argument(
         "--output",
         default=DEFAULT_OUTPUT,
@@ -171,7 +171,7 @@ def _run_case(
 def main() -> None:
     args = parse_args()
     base_config = load_bot_config(args.config)
-    bars = read_bars_from_csv(args.bars)
+    bars = read_bars(args.bars)
     results = [_run_case(case, base_config, bars) for case in _build_cases()]
 
     baseline = next(result for result in results if result["name"] == "baseline")
@@ -31,7 +31,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from research.src.adapters.csv_bar_repository import read_bars_from_csv
+from research.src.adapters.csv_bar_repository import read_bars
 from research.src.data.regime_tagger import attach_regime_tags
 from research.src.domain.backtest_engine import run_backtest
 from research.src.infra.research_config import load_bot_config
@@ -1115,7 +1115,7 @@ def main() -> None:
     args = parser.parse_args()
 
     base_config = load_bot_config(args.base_config)
-    all_bars = read_bars_from_csv(args.bars)
+    all_bars = read_bars(args.bars)
     total_needed = args.windows * args.window_bars
     if total_needed > len(all_bars):
         raise SystemExit(
@@ -24,7 +24,7 @@ from pathlib import Path
 from typing import Any
 
 from apps.dex_bot.domain.model.types import OhlcvBar
-from research.src.adapters.csv_bar_repository import read_bars_from_csv
+from research.src.adapters.csv_bar_repository import read_bars
 from research.src.data.regime_tagger import attach_regime_tags
 from research.src.domain.backtest_engine import run_backtest
 from research.src.infra.research_config import load_bot_config
@@ -211,7 +211,7 @@ def run(
     cases: list[_Case] | None = None,
 ) -> list[dict[str, Any]]:
     base_config = load_bot_config(base_config_path)
-    bars: list[OhlcvBar] = read_bars_from_csv(bars_path)
+    bars: list[OhlcvBar] = read_bars(bars_path)
     if tail_bars is not None and tail_bars > 0 and tail_bars < len(bars):
         bars = bars[-tail_bars:]
     attach_regime_tags(bars)
@@ -25,7 +25,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from research.src.adapters.csv_bar_repository import read_bars_from_csv
+from research.src.adapters.csv_bar_repository import read_bars
 from research.src.data.regime_tagger import attach_regime_tags
 from research.src.domain.backtest_engine import run_backtest
 from research.src.infra.research_config import load_bot_config
@@ -218,7 +218,7 @@ def main() -> None:
     base_config = load_bot_config(args.base_config)
     cases = _build_cases()
 
-    bars_all = read_bars_from_csv(args.bars)
+    bars_all = read_bars(args.bars)
     if args.tail_bars and args.tail_bars > 0 and args.tail_bars < len(bars_all):
         bars_all = bars_all[-args.tail_bars :]
     attach_regime_tags(bars_all)
@@ -231,7 +231,7 @@ def main() -> None:
 
     rolling_summary: list[dict[str, Any]] = []
     if args.rolling_windows > 0:
-        bars_full = read_bars_from_csv(args.bars)
+        bars_full = read_bars(args.bars)
         needed = args.rolling_windows * args.rolling_window_bars
         bars_full = bars_full[-needed:]
         attach_regime_tags(bars_full)
@@ -25,7 +25,7 @@ from apps.dex_bot.domain.model.types import OhlcvBar
 from apps.gmo_bot.adapters.execution.gmo_api_client import GmoApiClient
 from apps.gmo_bot.adapters.symbol_map import PAIR_SYMBOL_MAP
 from apps.gmo_bot.domain.utils.time import JST
-from research.src.adapters.csv_bar_repository import write_bars_to_csv
+from research.src.adapters.csv_bar_repository import write_bars
 
 
 def _date_token_for_jst_day(target_jst_day: datetime) -> str:
@@ -128,7 +128,7 @@ def main() -> None:
     )
     output = Path(args.output)
     output.parent.mkdir(parents=True, exist_ok=True)
-    write_bars_to_csv(output, bars)
+    write_bars(output, bars)
     if bars:
         first = bars[0].open_time.isoformat().replace("+00:00", "Z")
         last = bars[-1].open_time.isoformat().replace("+00:00", "Z")
@@ -3,14 +3,15 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from research.src.adapters.csv_bar_repository import read_bars_from_csv, write_bars_to_csv
-from research.src.data.partitioned_cache import PartitionedOhlcvCache, sync_ohlcv_cache
-from research.src.data.source_registry import fetch_recent_bars, get_provider, infer_broker
+# Data/provider modules (pyarrow, HTTP clients) are imported inside the
+# functions that use them so `--help` and argument errors return immediately.
 
 TIMEFRAME_TO_BARS_PER_DAY = {"15m": 96, "2h": 12, "4h": 6}
 
 
 def _build_provider(pair: str):
+    from research.src.data.source_registry import get_provider, infer_broker
+
     return get_provider(broker=infer_broker(pair), pair=pair)
 
 
@@ -38,23 +39,25 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--refresh",
         action="store_true",
-        help="force re-fetch even when output CSV already exists",
+        help="force re-fetch even when the output file already exists",
     )
     parser.add_argument(
         "--output",
-        default="research/data/raw/solusdc_2h.csv",
-        help="output CSV path",
+        default="research/data/raw/solusdc_2h.parquet",
+        help="output path; .parquet (default) or .csv for human inspection",
     )
     parser.add_argument("--cache-root", default="research/data/cache")
     parser.add_argument(
         "--no-cache",
         action="store_true",
-        help="legacy mode: fetch directly to CSV without updating parquet cache",
+        help="legacy mode: fetch directly to --output without updating parquet cache",
     )
     return parser.parse_args()
 
 
 def _fetch_direct(pair: str, timeframe: str, target_bars: int):
+    from research.src.data.source_registry import fetch_recent_bars
+
     provider = _build_provider(pair)
     return fetch_recent_bars(provider, pair=pair, timeframe=timeframe, limit=target_bars)
 
@@ -71,8 +74,11 @@ def main() -> None:
     output = Path(args.output)
     output.parent.mkdir(parents=True, exist_ok=True)
 
+    from research.src.adapters.csv_bar_repository import read_bars, write_bars
+    from research.src.data.source_registry import get_provider, infer_broker
+
     if output.exists() and not args.refresh:
-        cached_bars = read_bars_from_csv(output)
+        cached_bars = read_bars(output)
         if len(cached_bars) >= target_bars:
             print(
                 "[research] ohlcv reused",
@@ -93,6 +99,8 @@ def main() -> None:
     cache_updated = False
     if not args.no_cache:
         try:
+            from research.src.data.partitioned_cache import PartitionedOhlcvCache, sync_ohlcv_cache
+
             provider = get_provider(broker=broker, pair=pair)
             cache = PartitionedOhlcvCache(args.cache_root)
             sync_ohlcv_cache(
@@ -114,7 +122,7 @@ def main() -> None:
 
     if bars is None:
         bars = _fetch_direct(pair, timeframe, target_bars)
-    write_bars_to_csv(output, bars)
+    write_bars(output, bars)
 
     print(
         "[research] ohlcv fetched",
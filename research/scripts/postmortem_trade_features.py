@@ -31,7 +31,7 @@ from typing import Any
 import pandas as pd
 
 from apps.dex_bot.domain.model.types import OhlcvBar
-from research.src.adapters.csv_bar_repository import read_bars_from_csv
+from research.src.adapters.csv_bar_repository import read_bars
 from research.src.data.regime_tagger import attach_regime_tags
 from research.src.domain.backtest_engine import run_backtest
 from research.src.infra.research_config import load_bot_config
@@ -317,12 +317,12 @@ def main() -> None:
     output.mkdir(parents=True, exist_ok=True)
 
     print("[postmortem] loading bars...")
-    bars = read_bars_from_csv(args.bars)
+    bars = read_bars(args.bars)
     attach_regime_tags(bars)
     btc_bars = None
     btc_index_by_open = None
     if Path(args.btc_bars).exists():
-        btc_bars = read_bars_from_csv(args.btc_bars)
+        btc_bars = read_bars(args.btc_bars)
         btc_index_by_open = _build_bar_index(btc_bars)
         print(f"[postmortem] loaded {len(btc_bars)} BTC bars")
     else:
@@ -1,6 +1,6 @@
 """Resample 15m OHLCV CSV into longer-timeframe CSVs (1h / 4h / 1d).
 
-Reads a `read_bars_from_csv` compatible CSV (15m bars) and aggregates into
+Reads a `read_bars` compatible CSV or Parquet file (15m bars) and aggregates into
 hourly / 4-hour / daily buckets using standard OHLCV rules:
 
 - open: first bar's open
@@ -27,7 +27,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 
 from apps.dex_bot.domain.model.types import OhlcvBar
-from research.src.adapters.csv_bar_repository import read_bars_from_csv, write_bars_to_csv
+from research.src.adapters.csv_bar_repository import read_bars, write_bars
 
 TIMEFRAME_TO_MINUTES = {"1h": 60, "4h": 240, "1d": 1440}
 
@@ -105,7 +105,7 @@ def main() -> None:
         choices=sorted(TIMEFRAME_TO_MINUTES),
         help="target timeframe",
     )
-    parser.add_argument("--output", required=True, help="output CSV path")
+    parser.add_argument("--output", required=True, help="output path (.parquet or .csv)")
     parser.add_argument(
         "--source-minutes",
         type=int,
@@ -114,7 +114,7 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    source_bars = read_bars_from_csv(args.input)
+    source_bars = read_bars(args.input)
     aggregated = resample(
         bars=source_bars,
         target_timeframe=args.timeframe,
@@ -122,7 +122,7 @@ def main() -> None:
     )
     output = Path(args.output)
     output.parent.mkdir(parents=True, exist_ok=True)
-    write_bars_to_csv(output, aggregated)
+    write_bars(output, aggregated)
     first = aggregated[0].open_time.isoformat().replace("+00:00", "Z") if aggregated else None
     last = aggregated[-1].open_time.isoformat().replace("+00:00", "Z") if aggregated else None
     print(
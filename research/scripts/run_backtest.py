@@ -3,7 +3,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from research.src.app.backtest_usecase import BacktestInput, run_backtest_usecase
+from research.src.app.backtest_usecase import BacktestInput, run_backtest_batch
 from research.src.infra.research_config import load_bot_config
 
 
@@ -17,38 +17,54 @@ def _print_deprecation_notice() -> None:
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run offline backtest with shared dex-bot strategy")
-    parser.add_argument("--config", required=True, help="JSON config file path")
-    parser.add_argument("--bars", required=True, help="OHLCV CSV file path")
+    parser.add_argument(
+        "--config",
+        required=True,
+        nargs="+",
+        help="JSON config file path(s); several configs are run over the same bars",
+    )
+    parser.add_argument("--bars", required=True, help="OHLCV .parquet or .csv file path")
     parser.add_argument(
         "--output",
         default="research/data/processed/backtest_latest.json",
-        help="output report JSON path",
+        help="output report JSON path; with several configs, report N is written as <stem>.<N><suffix>",
     )
+    parser.add_argument("--workers", type=int, default=1, help="worker processes when several configs are given")
     return parser.parse_args()
 
 
 def main() -> None:
     _print_deprecation_notice()
     args = parse_args()
-    config = load_bot_config(args.config)
-
-    report = run_backtest_usecase(
-        BacktestInput(
-            config=config,
-            bars_path=args.bars,
-            output_path=args.output,
-        )
+    output_path = Path(args.output)
+    output_paths = [output_path]
+    if len(args.config) > 1:
+        output_paths = [
+            output_path.with_name(f"{output_path.stem}.{index}{output_path.suffix}") for index in range(len(args.config))
+        ]
+
+    reports = run_backtest_batch(
+        [
+            BacktestInput(
+                config=load_bot_config(config_path),
+                bars_path=args.bars,
+                output_path=str(output_path),
+            )
+            for config_path, output_path in zip(args.config, output_paths)
+        ],
+        workers=args.workers,
     )
 
-    top_reasons = sorted(
-        report.no_signal_reason_counts.items(),
-        key=lambda item: item[1],
-        reverse=True,
-    )[:5]
+    for config_path, output_path, report in zip(args.config, output_paths, reports):
+        top_reasons = sorted(
+            report.no_signal_reason_counts.items(),
+            key=lambda item: item[1],
+            reverse=True,
+        )[:5]
 
-    print("[research] backtest completed", report.summary.to_dict())
-    print("[research] top no-signal reasons", top_reasons)
-    print("[research] report", str(Path(args.output)))
+        print("[research] backtest completed", config_path, report.summary.to_dict())
+        print("[research] top no-signal reasons", top_reasons)
+        print("[research] report", str(output_path))
 
 
 if __name__ == "__main__":
@@ -6,7 +6,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from research.src.adapters.csv_bar_repository import read_bars_from_csv
+from research.src.adapters.csv_bar_repository import read_bars
 from research.src.data.market_dataset import MarketDataset
 from research.src.eval.runner import run_trials
 from research.src.store.lineage import build_run_id, capture_git_sha, now_utc_iso
@@ -50,7 +50,7 @@ def _load_dataset(spec: SweepSpec) -> MarketDataset:
     timeframe = str(dataset_spec["timeframe"])
     bars_path = dataset_spec.get("bars_path")
     if bars_path:
-        bars = read_bars_from_csv(_resolve_path(str(bars_path), spec=spec))
+        bars = read_bars(_resolve_path(str(bars_path), spec=spec))
         return MarketDataset.from_bars(broker=broker, pair=pair, timeframe=timeframe, bars=bars)
     return MarketDataset.load(
         broker=broker,
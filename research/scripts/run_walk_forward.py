@@ -1,15 +1,23 @@
 from __future__ import annotations
 
 import argparse
-from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime
-from statistics import mean, median
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
 from typing import Any
 
-from research.src.adapters.csv_bar_repository import write_json
+import numpy as np
+
+from apps.dex_bot.domain.model.types import OhlcvBar
+from research.src.adapters.csv_bar_repository import read_bar_columns, write_json
+from research.src.data.bar_columns import OhlcvColumns
 from research.src.domain.backtest_engine import run_backtest
 from research.src.infra.research_config import load_bot_config
-from research.src.adapters.csv_bar_repository import read_bars_from_csv
+from research.src.store.lineage import capture_git_dirty, capture_git_sha
 
 
 def _print_deprecation_notice() -> None:
@@ -23,7 +31,7 @@ def _print_deprecation_notice() -> None:
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run walk-forward backtest (train/test rolling windows)")
     parser.add_argument("--config", required=True, help="JSON config file path")
-    parser.add_argument("--bars", required=True, help="OHLCV CSV file path")
+    parser.add_argument("--bars", required=True, help="OHLCV .parquet or .csv file path")
     parser.add_argument("--train-days", type=float, default=180.0, help="train window days (default: 180)")
     parser.add_argument("--test-days", type=float, default=90.0, help="test window days (default: 90)")
     parser.add_argument(
@@ -38,6 +46,20 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="optional max number of windows to evaluate",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="process pool size for running windows in parallel (default: 1)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help=(
+            "optional directory for memoized per-slice backtest summaries, keyed by "
+            "bar data, config and git HEAD; bypassed when the code tree is dirty (default: disabled)"
+        ),
+    )
     parser.add_argument(
         "--output",
         default="research/data/processed/walk_forward_latest.json",
@@ -50,34 +72,33 @@ def _to_iso(value: datetime) -> str:
     return value.astimezone(UTC).isoformat().replace("+00:00", "Z")
 
 
-def _infer_bar_minutes(close_times: list[datetime]) -> int:
-    if len(close_times) < 2:
+def _close_time_deltas_minutes(close_time: np.ndarray) -> np.ndarray:
+    # astype(int64) truncates toward zero like the int(total_seconds / 60) it replaces.
+    return (np.diff(close_time) / np.timedelta64(1, "m")).astype(np.int64)
+
+
+def _infer_bar_minutes(deltas_minutes: np.ndarray) -> int:
+    if len(deltas_minutes) < 1:
         raise ValueError("walk-forward requires at least 2 OHLCV bars")
-    deltas: list[int] = []
-    for index in range(1, len(close_times)):
-        delta_minutes = int((close_times[index] - close_times[index - 1]).total_seconds() / 60)
-        if delta_minutes > 0:
-            deltas.append(delta_minutes)
-    if not deltas:
+    positive = deltas_minutes[deltas_minutes > 0]
+    if len(positive) == 0:
         raise ValueError("failed to infer bar interval")
-    inferred = Counter(deltas).most_common(1)[0][0]
+    values, first_index, counts = np.unique(positive, return_index=True, return_counts=True)
+    # On a count tie, take the interval seen first (Counter.most_common order).
+    most_common = np.flatnonzero(counts == counts.max())
+    inferred = int(values[most_common[np.argmin(first_index[most_common])]])
     if inferred <= 0 or 1440 % inferred != 0:
         raise ValueError(f"unsupported bar interval minutes: {inferred}")
     return inferred
 
 
-def _split_contiguous_segments(close_times: list[datetime], expected_minutes: int) -> list[tuple[int, int]]:
-    if not close_times:
-        return []
-    segments: list[tuple[int, int]] = []
-    segment_start = 0
-    for index in range(1, len(close_times)):
-        delta_minutes = int((close_times[index] - close_times[index - 1]).total_seconds() / 60)
-        if delta_minutes != expected_minutes:
-            segments.append((segment_start, index - 1))
-            segment_start = index
-    segments.append((segment_start, len(close_times) - 1))
-    return segments
+def _split_contiguous_segments(deltas_minutes: np.ndarray, expected_minutes: int) -> list[tuple[int, int]]:
+    # deltas_minutes[i] is the gap between bar i and bar i + 1, so a break at i
+    # ends one segment at i and starts the next at i + 1.
+    breaks = np.flatnonzero(deltas_minutes != expected_minutes)
+    starts = [0, *(breaks + 1).tolist()]
+    ends = [*breaks.tolist(), len(deltas_minutes)]
+    return list(zip(starts, ends))
 
 
 def _aggregate_test_summaries(windows: list[dict[str, Any]]) -> dict[str, Any]:
@@ -96,27 +117,94 @@ def _aggregate_test_summaries(windows: list[dict[str, Any]]) -> dict[str, Any]:
             "worst_window_id": None,
         }
 
-    test_pnls = [window["test"]["summary"]["total_scaled_pnl_pct"] for window in windows]
-    win_rates = [window["test"]["summary"]["win_rate_pct"] for window in windows]
-    closed_trades = [window["test"]["summary"]["closed_trades"] for window in windows]
-    average_r_values = [window["test"]["summary"]["average_r_multiple"] for window in windows]
-    positive_count = sum(1 for pnl in test_pnls if pnl > 0)
-
-    best_window = max(windows, key=lambda item: item["test"]["summary"]["total_scaled_pnl_pct"])
-    worst_window = min(windows, key=lambda item: item["test"]["summary"]["total_scaled_pnl_pct"])
+    summary_keys = ("total_scaled_pnl_pct", "win_rate_pct", "closed_trades", "average_r_multiple")
+    values = np.fromiter(
+        (window["test"]["summary"][key] for window in windows for key in summary_keys),
+        dtype=np.float64,
+        count=len(windows) * len(summary_keys),
+    ).reshape(len(windows), len(summary_keys))
+    test_pnls = values[:, 0]
 
     return {
         "count": len(windows),
-        "positive_ratio_pct": (positive_count / len(windows)) * 100,
-        "mean_total_scaled_pnl_pct": mean(test_pnls),
-        "median_total_scaled_pnl_pct": median(test_pnls),
-        "min_total_scaled_pnl_pct": min(test_pnls),
-        "max_total_scaled_pnl_pct": max(test_pnls),
-        "mean_win_rate_pct": mean(win_rates),
-        "mean_closed_trades": mean(closed_trades),
-        "mean_average_r_multiple": mean(average_r_values),
-        "best_window_id": best_window["window_id"],
-        "worst_window_id": worst_window["window_id"],
+        "positive_ratio_pct": float(np.count_nonzero(test_pnls > 0) / len(windows) * 100),
+        "mean_total_scaled_pnl_pct": float(test_pnls.mean()),
+        "median_total_scaled_pnl_pct": float(np.median(test_pnls)),
+        "min_total_scaled_pnl_pct": float(test_pnls.min()),
+        "max_total_scaled_pnl_pct": float(test_pnls.max()),
+        "mean_win_rate_pct": float(values[:, 1].mean()),
+        "mean_closed_trades": float(values[:, 2].mean()),
+        "mean_average_r_multiple": float(values[:, 3].mean()),
+        "best_window_id": windows[int(np.argmax(test_pnls))]["window_id"],
+        "worst_window_id": windows[int(np.argmin(test_pnls))]["window_id"],
+    }
+
+
+def _summary_cache_path(cache_dir: Path, columns: OhlcvColumns, config_fingerprint: str) -> Path:
+    digest = hashlib.sha256(config_fingerprint.encode("utf-8"))
+    for column in (
+        columns.open_time,
+        columns.close_time,
+        columns.open,
+        columns.high,
+        columns.low,
+        columns.close,
+        columns.volume,
+    ):
+        digest.update(column.tobytes())
+    return cache_dir / f"{digest.hexdigest()}.json"
+
+
+def _backtest_summary(
+    bars: list[OhlcvBar],
+    columns: OhlcvColumns,
+    config: dict[str, Any],
+    cache_path: Path | None,
+) -> dict[str, Any]:
+    if cache_path is not None and cache_path.exists():
+        try:
+            return json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            pass  # unreadable or truncated entry; recompute and overwrite it
+    summary = run_backtest(bars, config, columns=columns).summary.to_dict()
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write beside the target and rename, so readers never see a partial file.
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=f".{cache_path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(summary, handle)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    return summary
+
+
+def _run_window(
+    window_id: str,
+    segment_index: int,
+    train_slice: list[OhlcvBar],
+    test_slice: list[OhlcvBar],
+    train_columns: OhlcvColumns,
+    test_columns: OhlcvColumns,
+    train_cache_path: Path | None,
+    test_cache_path: Path | None,
+    config: dict[str, Any],
+) -> dict[str, Any]:
+    return {
+        "window_id": window_id,
+        "segment_index": segment_index,
+        "train": {
+            "start_close_time": _to_iso(train_slice[0].close_time),
+            "end_close_time": _to_iso(train_slice[-1].close_time),
+            "summary": _backtest_summary(train_slice, train_columns, config, train_cache_path),
+        },
+        "test": {
+            "start_close_time": _to_iso(test_slice[0].close_time),
+            "end_close_time": _to_iso(test_slice[-1].close_time),
+            "summary": _backtest_summary(test_slice, test_columns, config, test_cache_path),
+        },
     }
 
 
@@ -124,10 +212,11 @@ def main() -> None:
     _print_deprecation_notice()
     args = parse_args()
     config = load_bot_config(args.config)
-    bars = read_bars_from_csv(args.bars)
-    close_times = [bar.close_time for bar in bars]
+    columns = read_bar_columns(args.bars)
+    bars = columns.to_bars()
+    deltas_minutes = _close_time_deltas_minutes(columns.close_time)
 
-    bar_minutes = _infer_bar_minutes(close_times)
+    bar_minutes = _infer_bar_minutes(deltas_minutes)
     bars_per_day = int(1440 / bar_minutes)
 
     step_days = args.test_days if args.step_days is None else args.step_days
@@ -141,9 +230,30 @@ def main() -> None:
         )
 
     window_bars = train_bars + test_bars
-    segments = _split_contiguous_segments(close_times, bar_minutes)
-
-    window_results: list[dict[str, Any]] = []
+    segments = _split_contiguous_segments(deltas_minutes, bar_minutes)
+
+    cache_dir = Path(args.cache_dir) if args.cache_dir else None
+    # Windows with identical bars and config reuse the stored summary across
+    # invocations (e.g. re-running with a different --max-windows). HEAD is part
+    # of the key so committed engine or strategy changes never hit stale entries;
+    # without a known HEAD, or with uncommitted code, the cache is bypassed.
+    git_sha = capture_git_sha()
+    if cache_dir is not None and (git_sha is None or capture_git_dirty(":/apps", ":/research/src") is not False):
+        print("[research] --cache-dir ignored: git HEAD unavailable or apps/research code has uncommitted changes")
+        cache_dir = None
+    config_fingerprint = f"{git_sha}|{json.dumps(config, sort_keys=True)}"
+    window_tasks: list[
+        tuple[
+            str,
+            int,
+            list[OhlcvBar],
+            list[OhlcvBar],
+            OhlcvColumns,
+            OhlcvColumns,
+            Path | None,
+            Path | None,
+        ]
+    ] = []
     segment_summaries: list[dict[str, Any]] = []
 
     for segment_index, (segment_start, segment_end) in enumerate(segments):
@@ -158,49 +268,54 @@ def main() -> None:
                 test_start = train_end + 1
                 test_end = test_start + test_bars - 1
 
-                train_slice = bars[train_start : train_end + 1]
-                test_slice = bars[test_start : test_end + 1]
-
-                train_report = run_backtest(train_slice, config)
-                test_report = run_backtest(test_slice, config)
-
-                window_id = f"seg{segment_index}_w{windows_in_segment}"
-                window_results.append(
-                    {
-                        "window_id": window_id,
-                        "segment_index": segment_index,
-                        "train": {
-                            "start_close_time": _to_iso(train_slice[0].close_time),
-                            "end_close_time": _to_iso(train_slice[-1].close_time),
-                            "summary": train_report.summary.to_dict(),
-                        },
-                        "test": {
-                            "start_close_time": _to_iso(test_slice[0].close_time),
-                            "end_close_time": _to_iso(test_slice[-1].close_time),
-                            "summary": test_report.summary.to_dict(),
-                        },
-                    }
+                train_columns = columns.slice(train_start, train_end + 1)
+                test_columns = columns.slice(test_start, test_end + 1)
+                window_tasks.append(
+                    (
+                        f"seg{segment_index}_w{windows_in_segment}",
+                        segment_index,
+                        bars[train_start : train_end + 1],
+                        bars[test_start : test_end + 1],
+                        train_columns,
+                        test_columns,
+                        None
+                        if cache_dir is None
+                        else _summary_cache_path(cache_dir, train_columns, config_fingerprint),
+                        None
+                        if cache_dir is None
+                        else _summary_cache_path(cache_dir, test_columns, config_fingerprint),
+                    )
                 )
 
                 windows_in_segment += 1
                 cursor += step_bars
 
-                if args.max_windows is not None and len(window_results) >= args.max_windows:
+                if args.max_windows is not None and len(window_tasks) >= args.max_windows:
                     break
 
         segment_summaries.append(
             {
                 "segment_index": segment_index,
-                "start_close_time": _to_iso(close_times[segment_start]),
-                "end_close_time": _to_iso(close_times[segment_end]),
+                "start_close_time": _to_iso(bars[segment_start].close_time),
+                "end_close_time": _to_iso(bars[segment_end].close_time),
                 "bars": segment_length,
                 "windows": windows_in_segment,
             }
         )
 
-        if args.max_windows is not None and len(window_results) >= args.max_windows:
+        if args.max_windows is not None and len(window_tasks) >= args.max_windows:
             break
 
+    # Every window is an independent pair of backtests. executor.map yields in
+    # submission order, so the report is identical to a sequential run.
+    if args.workers <= 1:
+        window_results = [_run_window(*task, config) for task in window_tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            window_results = list(
+                executor.map(_run_window, *zip(*window_tasks), [config] * len(window_tasks))
+            )
+
     report = {
         "config_path": args.config,
         "bars_path": args.bars,
@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Any
 from urllib import request
 
-from research.src.adapters.csv_bar_repository import read_bars_from_csv
+from research.src.adapters.csv_bar_repository import read_bars
 from research.src.domain.backtest_engine import run_backtest
 from research.src.eval.shadow_compare import compare_trade_logs
 from research.src.infra.research_config import load_bot_config
@@ -64,7 +64,7 @@ def main() -> None:
     parser.add_argument("--to-date-jst", default=None)
     parser.add_argument("--backtest-trades-json", default=None, help="precomputed backtest trades JSON")
     parser.add_argument("--config", default=None, help="config path used to run shadow backtest")
-    parser.add_argument("--bars-path", default=None, help="OHLCV CSV used to run shadow backtest")
+    parser.add_argument("--bars-path", default=None, help="OHLCV .parquet or .csv used to run shadow backtest")
     parser.add_argument("--output", default=None)
     parser.add_argument("--slack-webhook-url", default=None)
     parser.add_argument("--slack-on-threshold", type=float, default=None, help="PnL deviation threshold; e.g. 0.05")
@@ -79,7 +79,7 @@ def main() -> None:
     if args.backtest_trades_json:
         backtest_trades = _load_json_list(args.backtest_trades_json)
     elif args.config and args.bars_path:
-        report = run_backtest(read_bars_from_csv(args.bars_path), load_bot_config(args.config))
+        report = run_backtest(read_bars(args.bars_path), load_bot_config(args.config))
         backtest_trades = [trade.to_dict() for trade in report.trades]
     else:
         raise ValueError("provide --backtest-trades-json or both --config and --bars-path")
@@ -1,13 +1,30 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from multiprocessing.shared_memory import SharedMemory
 
-from apps.dex_bot.domain.model.types import BotConfig
+import numpy as np
 
-from research.src.adapters.csv_bar_repository import read_bars_from_csv, write_json
+from apps.dex_bot.domain.model.types import BotConfig, OhlcvBar
+
+from research.src.adapters.csv_bar_repository import read_bar_columns, read_bars, write_json
+from research.src.data.bar_columns import OhlcvColumns
 from research.src.domain.backtest_engine import run_backtest
 from research.src.domain.backtest_types import BacktestReport
 
+# Every OhlcvColumns field is 8 bytes wide (datetime64[us] or float64), so the
+# columns are laid out back to back in one shared block.
+_COLUMN_DTYPES = tuple(
+    (field.name, "datetime64[us]" if field.name.endswith("_time") else "float64") for field in fields(OhlcvColumns)
+)
+_COLUMN_ITEMSIZE = 8
+
+# Set once per worker process by _init_backtest_worker: bars path -> (block name, bar count).
+_WORKER_BLOCKS: dict[str, tuple[str, int]] = {}
+# Bars each worker process has already loaded from a shared block, keyed by block name.
+_WORKER_SHARED_BARS: dict[str, tuple[OhlcvColumns, list[OhlcvBar]]] = {}
+
 
 @dataclass
 class BacktestInput:
@@ -17,10 +34,99 @@ class BacktestInput:
 
 
 def run_backtest_usecase(input_data: BacktestInput) -> BacktestReport:
-    bars = read_bars_from_csv(input_data.bars_path)
+    bars = read_bars(input_data.bars_path)
     report = run_backtest(bars=bars, config=input_data.config)
 
     if input_data.output_path:
         write_json(input_data.output_path, report.to_dict())
 
     return report
+
+
+def _copy_columns_to_shared_memory(columns: OhlcvColumns) -> SharedMemory:
+    count = len(columns)
+    shm = SharedMemory(create=True, size=max(1, count * _COLUMN_ITEMSIZE * len(_COLUMN_DTYPES)))
+    for position, (name, dtype) in enumerate(_COLUMN_DTYPES):
+        view = np.ndarray((count,), dtype=dtype, buffer=shm.buf, offset=position * count * _COLUMN_ITEMSIZE)
+        view[:] = getattr(columns, name)
+        del view
+    return shm
+
+
+def _load_shared_bars(shm_name: str, count: int) -> tuple[OhlcvColumns, list[OhlcvBar]]:
+    cached = _WORKER_SHARED_BARS.get(shm_name)
+    if cached is None:
+        shm = SharedMemory(name=shm_name)
+        try:
+            # Copy out of the block so no view outlives close(), even when a backtest fails later.
+            columns = OhlcvColumns(
+                **{
+                    name: np.ndarray(
+                        (count,), dtype=dtype, buffer=shm.buf, offset=position * count * _COLUMN_ITEMSIZE
+                    ).copy()
+                    for position, (name, dtype) in enumerate(_COLUMN_DTYPES)
+                }
+            )
+        finally:
+            shm.close()
+        cached = _WORKER_SHARED_BARS[shm_name] = (columns, columns.to_bars())
+    return cached
+
+
+def _init_backtest_worker(blocks: dict[str, tuple[str, int]]) -> None:
+    global _WORKER_BLOCKS
+    _WORKER_BLOCKS = blocks
+
+
+def _run_shared_backtest(input_data: BacktestInput) -> BacktestReport:
+    columns, bars = _load_shared_bars(*_WORKER_BLOCKS[input_data.bars_path])
+    report = run_backtest(bars=bars, config=input_data.config, columns=columns)
+    if input_data.output_path:
+        write_json(input_data.output_path, report.to_dict())
+    return report
+
+
+def run_backtest_batch(inputs: list[BacktestInput], *, workers: int = 1) -> list[BacktestReport]:
+    """Run independent backtests, fanning out over processes when workers > 1.
+
+    Each distinct bars file is loaded once. In parallel mode its columns are
+    placed in shared memory; each worker copies it out and builds the bar
+    list once per file, so a sweep does not pickle the bar history per
+    config. Reports are returned in input order.
+    """
+    if workers <= 1:
+        columns_by_path: dict[str, OhlcvColumns] = {}
+        bars_by_path: dict[str, list[OhlcvBar]] = {}
+        reports: list[BacktestReport] = []
+        for input_data in inputs:
+            if input_data.bars_path not in columns_by_path:
+                columns_by_path[input_data.bars_path] = read_bar_columns(input_data.bars_path)
+                bars_by_path[input_data.bars_path] = columns_by_path[input_data.bars_path].to_bars()
+            report = run_backtest(
+                bars=bars_by_path[input_data.bars_path],
+                config=input_data.config,
+                columns=columns_by_path[input_data.bars_path],
+            )
+            if input_data.output_path:
+                write_json(input_data.output_path, report.to_dict())
+            reports.append(report)
+        return reports
+
+    shared_by_path: dict[str, tuple[SharedMemory, int]] = {}
+    try:
+        for input_data in inputs:
+            if input_data.bars_path not in shared_by_path:
+                columns = read_bar_columns(input_data.bars_path)
+                shared_by_path[input_data.bars_path] = (_copy_columns_to_shared_memory(columns), len(columns))
+        blocks = {path: (shm.name, count) for path, (shm, count) in shared_by_path.items()}
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_backtest_worker,
+            initargs=(blocks,),
+        ) as executor:
+            return list(executor.map(_run_shared_backtest, inputs))
+    finally:
+        for shm, _ in shared_by_path.values():
+            shm.close()
+            shm.unlink()
+
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from research.src.data.bar_columns import OhlcvColumns
 from research.src.data.market_dataset import DatasetKey, MarketDataset, compute_data_hash
 from research.src.data.partitioned_cache import (
     CacheSyncResult,
@@ -17,6 +18,7 @@ __all__ = [
     "CacheSyncResult",
     "DatasetKey",
     "MarketDataset",
+    "OhlcvColumns",
     "PartitionedOhlcvCache",
     "broker_to_safe",
     "compute_data_hash",
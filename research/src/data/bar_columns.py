@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Sequence
+
+import numpy as np
+
+from apps.dex_bot.domain.model.types import OhlcvBar
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_epoch_us(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+@dataclass(frozen=True)
+class OhlcvColumns:
+    """Struct-of-arrays copy of a bar sequence.
+
+    Times are ``datetime64[us]`` (UTC, naive) and prices float64. ``slice``
+    returns numpy views, so windowing a long history does not copy any data.
+    Strategies still consume ``list[OhlcvBar]``; this is for the numeric
+    passes around them (interval inference, window bounds, touch checks).
+    Repositories load straight into columns and ``to_bars`` materializes the
+    object view once.
+    """
+
+    open_time: np.ndarray
+    close_time: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @classmethod
+    def from_bars(cls, bars: Sequence[OhlcvBar]) -> "OhlcvColumns":
+        count = len(bars)
+
+        def _times(attr: str) -> np.ndarray:
+            values = np.fromiter((_to_epoch_us(getattr(bar, attr)) for bar in bars), dtype=np.int64, count=count)
+            return values.view("datetime64[us]")
+
+        def _floats(attr: str) -> np.ndarray:
+            return np.fromiter((getattr(bar, attr) for bar in bars), dtype=np.float64, count=count)
+
+        return cls(
+            open_time=_times("open_time"),
+            close_time=_times("close_time"),
+            open=_floats("open"),
+            high=_floats("high"),
+            low=_floats("low"),
+            close=_floats("close"),
+            volume=_floats("volume"),
+        )
+
+    def to_bars(self) -> list[OhlcvBar]:
+        open_times = self.open_time.view(np.int64).tolist()
+        close_times = self.close_time.view(np.int64).tolist()
+        return [
+            OhlcvBar(
+                open_time=_EPOCH + timedelta(microseconds=open_us),
+                close_time=_EPOCH + timedelta(microseconds=close_us),
+                open=open_,
+                high=high,
+                low=low,
+                close=close,
+                volume=volume,
+            )
+            for open_us, close_us, open_, high, low, close, volume in zip(
+                open_times,
+                close_times,
+                self.open.tolist(),
+                self.high.tolist(),
+                self.low.tolist(),
+                self.close.tolist(),
+                self.volume.tolist(),
+            )
+        ]
+
+    def __len__(self) -> int:
+        return len(self.close_time)
+
+    def slice(self, start: int, stop: int) -> "OhlcvColumns":
+        return OhlcvColumns(
+            open_time=self.open_time[start:stop],
+            close_time=self.close_time[start:stop],
+            open=self.open[start:stop],
+            high=self.high[start:stop],
+            low=self.low[start:stop],
+            close=self.close[start:stop],
+            volume=self.volume[start:stop],
+        )
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from collections import Counter
+from collections import defaultdict
 import random
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
+
 from apps.dex_bot.domain.model.types import BotConfig, Direction, ModelDirection, OhlcvBar, TradeRecord
 from apps.dex_bot.domain.risk.loss_streak_trade_cap import LOSS_STREAK_LOOKBACK_CLOSED_TRADES
 from apps.dex_bot.domain.risk.loss_streak_trade_cap import resolve_effective_max_trades_per_day_for_strategy
@@ -30,6 +33,7 @@ from apps.dex_bot.domain.strategy.registry import evaluate_strategy_for_model as
 from apps.gmo_bot.domain.strategy.components import (
     BreakEvenAction,
     CloseAction,
+    FixedRExit,
     HoldAction,
     PartialTpAction,
     PositionContext,
@@ -42,11 +46,12 @@ from shared.utils.math import round_to
 from apps.dex_bot.domain.utils.time import get_bar_duration_seconds
 
 from research.src.domain.backtest_types import BacktestReport, BacktestSummary, BacktestTrade
+from research.src.data.bar_columns import OhlcvColumns
 from research.src.data.regime_tagger import attach_regime_tags, get_bar_regime
 from research.src.eval.execution_model import RejectedEntry, build_execution_model, buy_fill_price, sell_fill_price
 
 
-@dataclass
+@dataclass(slots=True)
 class _OpenPosition:
     entry_index: int
     entry_time: datetime
@@ -72,14 +77,20 @@ class _OpenPosition:
     partial_pnl_accrued_usdc: float = 0.0
 
 
+# A closing bar's time is formatted twice (trade record and loss-streak record),
+# and walk-forward windows revisit the same bars. Equal instants in different
+# zones share a cache slot, which is fine since the output is UTC either way.
+@lru_cache(maxsize=8192)
 def _to_utc_iso(value: datetime) -> str:
-    return value.astimezone(UTC).isoformat().replace("+00:00", "Z")
+    if value.tzinfo is not UTC:
+        value = value.astimezone(UTC)
+    return value.isoformat().replace("+00:00", "Z")
 
 
-def _safe_average(values: list[float]) -> float:
-    if not values:
+def _safe_average(total: float, count: int) -> float:
+    if count == 0:
         return 0.0
-    return sum(values) / len(values)
+    return total / count
 
 
 DEFAULT_INITIAL_QUOTE_BALANCE = 100.0
@@ -172,6 +183,40 @@ def _strategy_uses_component_bundle(config: BotConfig) -> bool:
     return config["strategy"]["name"] in _COMPONENT_BUNDLE_STRATEGIES
 
 
+_TOUCH_SCAN_BLOCK_BARS = 256
+_MICROSECONDS_PER_DAY = 86_400_000_000
+
+
+def _first_touch_index(
+    columns: OhlcvColumns,
+    *,
+    start: int,
+    stop_price: float,
+    take_profit_price: float,
+    is_long: bool,
+) -> int:
+    """Return the first bar index >= ``start`` whose range reaches stop or TP.
+
+    Returns ``len(columns)`` when neither level is touched. The scan runs in
+    doubling blocks so a short-lived position does not compare the whole
+    remaining history.
+    """
+    total = len(columns)
+    block = _TOUCH_SCAN_BLOCK_BARS
+    while start < total:
+        stop = min(total, start + block)
+        if is_long:
+            touched = (columns.low[start:stop] <= stop_price) | (columns.high[start:stop] >= take_profit_price)
+        else:
+            touched = (columns.high[start:stop] >= stop_price) | (columns.low[start:stop] <= take_profit_price)
+        hits = np.flatnonzero(touched)
+        if hits.size:
+            return start + int(hits[0])
+        start = stop
+        block *= 2
+    return total
+
+
 def _evaluate_strategy_for_backtest(
     *,
     config: BotConfig,
@@ -201,7 +246,17 @@ def _evaluate_strategy_for_backtest(
     )
 
 
-def run_backtest(bars: list[OhlcvBar], config: BotConfig) -> BacktestReport:
+def run_backtest(
+    bars: list[OhlcvBar],
+    config: BotConfig,
+    *,
+    columns: OhlcvColumns | None = None,
+) -> BacktestReport:
+    """Replay ``bars`` through the configured strategy and execution model.
+
+    ``columns`` is the same data as numpy arrays (e.g. from ``read_bar_columns``
+    or ``OhlcvColumns.slice``); pass it to skip rebuilding it from ``bars``.
+    """
     if len(bars) < 2:
         raise ValueError("Backtest requires at least 2 OHLCV bars")
     # Ensure regime tags are present. When bars are shipped to worker processes via
@@ -210,22 +265,50 @@ def run_backtest(bars: list[OhlcvBar], config: BotConfig) -> BacktestReport:
     if not hasattr(bars[0], "regime"):
         attach_regime_tags(bars)
     direction = config["direction"]
+    # Loop invariants: the config sub-dicts and the strategy name are read on
+    # every flat bar, so bind them once.
+    strategy_config = config["strategy"]
+    risk_config = config["risk"]
+    exit_config = config["exit"]
+    execution_config = config["execution"]
+    strategy_name = strategy_config["name"]
+    short_stop_loss_cooldown_enabled = is_short_stop_loss_cooldown_enabled(strategy_name)
     uses_components = _strategy_uses_component_bundle(config)
     strategy_bundle: StrategyBundle | None = (
-        resolve_strategy_bundle(config["strategy"]) if uses_components else None
+        resolve_strategy_bundle(strategy_config) if uses_components else None
     )
-    configured_min_notional_usdc = float(config["execution"]["min_notional_usdc"])
-    slippage_bps = int(config["execution"]["slippage_bps"])
-    max_trades_per_day = config["risk"]["max_trades_per_day"]
-    max_loss_per_trade_pct = float(config["risk"]["max_loss_per_trade_pct"])
-    take_profit_r_multiple = float(config["exit"]["take_profit_r_multiple"])
+    configured_min_notional_usdc = float(execution_config["min_notional_usdc"])
+    slippage_bps = int(execution_config["slippage_bps"])
+    max_trades_per_day = risk_config["max_trades_per_day"]
+    max_loss_per_trade_pct = float(risk_config["max_loss_per_trade_pct"])
+    take_profit_r_multiple = float(exit_config["take_profit_r_multiple"])
     ohlcv_limit = _resolve_ohlcv_limit(config)
     bar_duration_seconds = get_bar_duration_seconds(config["signal_timeframe"])
     portfolio_quote_usdc = _resolve_initial_quote_balance(config)
-    execution_seed_raw = config["execution"].get("seed")
+    execution_seed_raw = execution_config.get("seed")
     execution_seed = int(execution_seed_raw) if isinstance(execution_seed_raw, int) or (isinstance(execution_seed_raw, str) and execution_seed_raw.isdigit()) else None
     rng = random.Random(execution_seed)
-    execution_model = build_execution_model(config["execution"])
+    execution_model = build_execution_model(execution_config)
+    # Indexed by the 2-bit touch case: bit 0 = stop touched, bit 1 = TP touched.
+    exit_fill_simulators = (
+        None,
+        execution_model.simulate_stop_fill,
+        execution_model.simulate_tp_fill,
+        execution_model.simulate_same_bar_stop_and_tp,
+    )
+    if columns is None:
+        columns = OhlcvColumns.from_bars(bars)
+    elif len(columns) != len(bars):
+        raise ValueError(f"columns length {len(columns)} does not match bars length {len(bars)}")
+    # Plain float lists for the per-bar touch check: list indexing is cheaper
+    # than both dataclass attribute access and numpy scalar indexing.
+    lows = columns.low.tolist()
+    highs = columns.high.tolist()
+    # UTC calendar day of each bar's close as an integer, for the daily entry cap.
+    # Offsetting by the earliest day turns it into a slot in daily_entry_counts.
+    close_days = columns.close_time.view(np.int64) // _MICROSECONDS_PER_DAY
+    first_close_day = int(close_days.min())
+    close_day_indexes = (close_days - first_close_day).tolist()
 
     open_position: _OpenPosition | None = None
     trades: list[BacktestTrade] = []
@@ -233,11 +316,20 @@ def run_backtest(bars: list[OhlcvBar], config: BotConfig) -> BacktestReport:
     closed_exit_reasons: list[str] = []
     latest_short_close_reason: str | None = None
     latest_short_close_index: int | None = None
-    no_signal_reasons: Counter[str] = Counter()
-    daily_entry_counts: dict[str, int] = {}
+    no_signal_reasons: defaultdict[str, int] = defaultdict(int)
+    daily_entry_counts = [0] * (int(close_days.max()) - first_close_day + 1)
     enter_count = 0
     no_signal_count = 0
     gate_state: dict[str, Any] = {"recent_r_multiples": []}
+    # The dynamic daily cap only depends on closed_exit_reasons, so it is
+    # re-resolved when that list grows rather than on every flat bar.
+    effective_max_trades_per_day = max_trades_per_day
+    cap_resolved_for_closes = -1
+    # First bar the open position needs to be looked at again. Legacy strategies
+    # and bundles with FixedRExit never move stop/TP, so the bars until the
+    # first touch are found in one numpy scan instead of being visited one by one.
+    next_exit_check_index = 0
+    exit_levels_fixed = strategy_bundle is None or isinstance(strategy_bundle.exit_policy, FixedRExit)
 
     def _record_close(
         *,
@@ -247,19 +339,21 @@ def run_backtest(bars: list[OhlcvBar], config: BotConfig) -> BacktestReport:
         exit_reason: str,
         bar_index: int,
     ) -> float:
-        is_long_local = position.direction == "LONG"
-        if is_long_local:
-            risk_per_unit = position.entry_price - position.stop_price
-            pnl_per_unit = exit_price - position.entry_price
+        entry_price = position.entry_price
+        stop_price = position.stop_price
+        base_notional_usdc = position.base_notional_usdc
+        if position.direction == "LONG":
+            risk_per_unit = entry_price - stop_price
+            pnl_per_unit = exit_price - entry_price
         else:
-            risk_per_unit = position.stop_price - position.entry_price
-            pnl_per_unit = position.entry_price - exit_price
+            risk_per_unit = stop_price - entry_price
+            pnl_per_unit = entry_price - exit_price
         position_pnl_usdc = position.quantity_sol * pnl_per_unit
-        portfolio_after_exit = position.base_notional_usdc + position_pnl_usdc
-        pnl_pct_local = (pnl_per_unit / position.entry_price) * 100
+        portfolio_after_exit = base_notional_usdc + position_pnl_usdc
+        pnl_pct_local = (pnl_per_unit / entry_price) * 100
         scaled_pnl_pct_local = (
-            ((portfolio_after_exit / position.base_notional_usdc) - 1) * 100
-            if position.base_notional_usdc > 0
+            ((portfolio_after_exit / base_notional_usdc) - 1) * 100
+            if base_notional_usdc > 0
             else 0.0
         )
         r_multiple_local = (pnl_per_unit / risk_per_unit) if risk_per_unit > 0 else 0.0
@@ -267,8 +361,8 @@ def run_backtest(bars: list[OhlcvBar], config: BotConfig) -> BacktestReport:
             BacktestTrade(
                 entry_time=_to_utc_iso(position.entry_time),
                 exit_time=_to_utc_iso(current_bar.close_time),
-                entry_price=round_to(position.entry_price, 6),
-                stop_price=round_to(position.stop_price, 6),
+                entry_price=round_to(entry_price, 6),
+                stop_price=round_to(stop_price, 6),
                 take_profit_price=round_to(position.take_profit_price, 6),
                 exit_price=round_to(exit_price, 6),
                 exit_reason=exit_reason,
@@ -276,7 +370,7 @@ def run_backtest(bars: list[OhlcvBar], config: BotConfig) -> BacktestReport:
                 scaled_pnl_pct=round_to(scaled_pnl_pct_local, 6),
                 r_multiple=round_to(r_multiple_local, 6),
                 position_size_multiplier=round_to(position.position_size_multiplier, 4),
-                base_notional_usdc=round_to(position.base_notional_usdc, 2),
+                base_notional_usdc=round_to(base_notional_usdc, 2),
                 effective_notional_usdc=round_to(position.effective_notional_usdc, 2),
                 holding_bars=bar_index - position.entry_index,
                 entry_regime=dict(position.entry_regime),
@@ -288,7 +382,7 @@ def run_backtest(bars: list[OhlcvBar], config: BotConfig) -> BacktestReport:
 
     for index, current_bar in enumerate(bars):
         if open_position is not None:
-            if index <= open_position.entry_index:
+            if index < next_exit_check_index:
                 continue
 
             if strategy_bundle is not None:
@@ -435,35 +529,22 @@ def run_backtest(bars: list[OhlcvBar], config: BotConfig) -> BacktestReport:
                 # HoldAction or stop adjustment: fall through to standard touch check.
 
             is_long = open_position.direction == "LONG"
+            bar_low = lows[index]
+            bar_high = highs[index]
+            stop_price = open_position.stop_price
+            take_profit_price = open_position.take_profit_price
             if is_long:
-                stop_hit = current_bar.low <= open_position.stop_price
-                tp_hit = current_bar.high >= open_position.take_profit_price
+                touch_case = (bar_low <= stop_price) | ((bar_high >= take_profit_price) << 1)
             else:
-                stop_hit = current_bar.high >= open_position.stop_price
-                tp_hit = current_bar.low <= open_position.take_profit_price
+                touch_case = (bar_high >= stop_price) | ((bar_low <= take_profit_price) << 1)
 
-            if stop_hit or tp_hit:
-                if stop_hit and tp_hit:
-                    exit_fill = execution_model.simulate_same_bar_stop_and_tp(
-                        position=open_position,
-                        bar=current_bar,
-                        slippage_bps=slippage_bps,
-                        rng=rng,
-                    )
-                elif stop_hit:
-                    exit_fill = execution_model.simulate_stop_fill(
-                        position=open_position,
-                        bar=current_bar,
-                        slippage_bps=slippage_bps,
-                        rng=rng,
-                    )
-                else:
-                    exit_fill = execution_model.simulate_tp_fill(
-                        position=open_position,
-                        bar=current_bar,
-                        slippage_bps=slippage_bps,
-                        rng=rng,
-                    )
+            if touch_case:
+                exit_fill = exit_fill_simulators[touch_case](
+                    position=open_position,
+                    bar=current_bar,
+                    slippage_bps=slippage_bps,
+                    rng=rng,
+                )
                 exit_reason = exit_fill.reason
                 exit_price = exit_fill.price
                 portfolio_after_exit = _record_close(
@@ -499,14 +580,16 @@ def run_backtest(bars: list[OhlcvBar], config: BotConfig) -> BacktestReport:
                 open_position = None
             continue
 
-        day_key = current_bar.close_time.astimezone(UTC).date().isoformat()
-        trades_today = daily_entry_counts.get(day_key, 0)
-        recent_close_reasons = list(reversed(closed_exit_reasons[-LOSS_STREAK_LOOKBACK_CLOSED_TRADES:]))
-        effective_max_trades_per_day, _, _ = resolve_effective_max_trades_per_day_for_strategy(
-            strategy_name=config["strategy"]["name"],
-            base_max_trades_per_day=max_trades_per_day,
-            recent_close_reasons=recent_close_reasons,
-        )
+        day_key = close_day_indexes[index]
+        trades_today = daily_entry_counts[day_key]
+        if cap_resolved_for_closes != len(closed_exit_reasons):
+            cap_resolved_for_closes = len(closed_exit_reasons)
+            recent_close_reasons = list(reversed(closed_exit_reasons[-LOSS_STREAK_LOOKBACK_CLOSED_TRADES:]))
+            effective_max_trades_per_day, _, _ = resolve_effective_max_trades_per_day_for_strategy(
+                strategy_name=strategy_name,
+                base_max_trades_per_day=max_trades_per_day,
+                recent_close_reasons=recent_close_reasons,
+            )
         if trades_today >= effective_max_trades_per_day:
             no_signal_count += 1
             no_signal_reasons["MAX_TRADES_PER_DAY_REACHED"] += 1
@@ -522,16 +605,19 @@ def run_backtest(bars: list[OhlcvBar], config: BotConfig) -> BacktestReport:
             no_signal_reasons[strategy_bundle.regime_gate.reject_reason()] += 1
             continue
 
+        # Same fixed-size window the live bot fetches, so the copy is O(ohlcv_limit)
+        # per bar rather than a growing prefix. Strategies get a real list: they
+        # slice it and key caches on its identity.
         decision_window_start = max(0, index + 1 - ohlcv_limit)
         decision_bars = bars[decision_window_start : index + 1]
         decision = _evaluate_strategy_for_backtest(
             config=config,
             direction=direction,
             bars=decision_bars,
-            strategy=config["strategy"],
-            risk=config["risk"],
-            exit=config["exit"],
-            execution=config["execution"],
+            strategy=strategy_config,
+            risk=risk_config,
+            exit=exit_config,
+            execution=execution_config,
         )
 
         if decision.type == "NO_SIGNAL":
@@ -554,7 +640,7 @@ def run_backtest(bars: list[OhlcvBar], config: BotConfig) -> BacktestReport:
             continue
         if (
             entry_direction == "SHORT"
-            and is_short_stop_loss_cooldown_enabled(config["strategy"]["name"])
+            and short_stop_loss_cooldown_enabled
             and latest_short_close_reason == "STOP_LOSS"
             and latest_short_close_index is not None
         ):
@@ -572,7 +658,7 @@ def run_backtest(bars: list[OhlcvBar], config: BotConfig) -> BacktestReport:
                 _short_regime_guard_recent_short_trades,
                 _short_regime_guard_recent_short_win_rate_pct,
             ) = resolve_short_regime_guard_state(
-                strategy_name=config["strategy"]["name"],
+                strategy_name=strategy_name,
                 recent_closed_trades=recent_closed_trades,
                 current_bar_close_time=current_bar.close_time,
                 bar_duration_seconds=bar_duration_seconds,
@@ -721,6 +807,16 @@ def run_backtest(bars: list[OhlcvBar], config: BotConfig) -> BacktestReport:
             initial_base_notional_usdc=base_notional_usdc,
             remaining_fraction=1.0,
         )
+        if exit_levels_fixed:
+            next_exit_check_index = _first_touch_index(
+                columns,
+                start=entry_fill.bar_index + 1,
+                stop_price=final_stop,
+                take_profit_price=take_profit_price,
+                is_long=entry_direction == "LONG",
+            )
+        else:
+            next_exit_check_index = entry_fill.bar_index + 1
 
     if open_position is not None:
         trades.append(
@@ -745,32 +841,38 @@ def run_backtest(bars: list[OhlcvBar], config: BotConfig) -> BacktestReport:
             )
         )
 
-    closed_trades = [trade for trade in trades if trade.exit_reason != "OPEN"]
-    wins = sum(1 for trade in closed_trades if trade.exit_reason == "TAKE_PROFIT")
-    losses = len(closed_trades) - wins
-    pnl_values = [trade.pnl_pct for trade in closed_trades if trade.pnl_pct is not None]
-    scaled_pnl_values = [
-        trade.scaled_pnl_pct for trade in closed_trades if trade.scaled_pnl_pct is not None
-    ]
-    r_values = [trade.r_multiple for trade in closed_trades if trade.r_multiple is not None]
+    # One walk over the trades for every summary aggregate. Closed trades always
+    # carry pnl/scaled pnl/R, so only the trailing OPEN row needs skipping.
+    closed_count = 0
+    wins = 0
+    total_pnl_pct = 0.0
+    total_scaled_pnl_pct = 0.0
+    total_r_multiple = 0.0
+    for trade in trades:
+        if trade.exit_reason == "OPEN":
+            continue
+        closed_count += 1
+        if trade.exit_reason == "TAKE_PROFIT":
+            wins += 1
+        total_pnl_pct += trade.pnl_pct
+        total_scaled_pnl_pct += trade.scaled_pnl_pct
+        total_r_multiple += trade.r_multiple
 
     report = BacktestReport(
         summary=BacktestSummary(
             total_bars=len(bars),
             decision_enter_count=enter_count,
             decision_no_signal_count=no_signal_count,
-            closed_trades=len(closed_trades),
-            open_trades=len(trades) - len(closed_trades),
+            closed_trades=closed_count,
+            open_trades=len(trades) - closed_count,
             wins=wins,
-            losses=losses,
-            win_rate_pct=round_to((wins / len(closed_trades) * 100) if closed_trades else 0.0, 4),
-            average_pnl_pct=round_to(_safe_average([value for value in pnl_values if value is not None]), 6),
-            total_pnl_pct=round_to(sum(pnl_values), 6),
-            average_scaled_pnl_pct=round_to(
-                _safe_average([value for value in scaled_pnl_values if value is not None]), 6
-            ),
-            total_scaled_pnl_pct=round_to(sum(scaled_pnl_values), 6),
-            average_r_multiple=round_to(_safe_average([value for value in r_values if value is not None]), 6),
+            losses=closed_count - wins,
+            win_rate_pct=round_to((wins / closed_count * 100) if closed_count else 0.0, 4),
+            average_pnl_pct=round_to(_safe_average(total_pnl_pct, closed_count), 6),
+            total_pnl_pct=round_to(total_pnl_pct, 6),
+            average_scaled_pnl_pct=round_to(_safe_average(total_scaled_pnl_pct, closed_count), 6),
+            total_scaled_pnl_pct=round_to(total_scaled_pnl_pct, 6),
+            average_r_multiple=round_to(_safe_average(total_r_multiple, closed_count), 6),
             first_bar_close_time=_to_utc_iso(bars[0].close_time),
             last_bar_close_time=_to_utc_iso(bars[-1].close_time),
             execution_model_id=execution_model.model_id,
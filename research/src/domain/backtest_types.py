@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from typing import Any, Literal
 
 ExitReason = Literal[
@@ -13,7 +13,7 @@ ExitReason = Literal[
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestTrade:
     entry_time: str
     exit_time: str | None
@@ -34,10 +34,28 @@ class BacktestTrade:
     execution_seed: int | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "entry_time": self.entry_time,
+            "exit_time": self.exit_time,
+            "entry_price": self.entry_price,
+            "stop_price": self.stop_price,
+            "take_profit_price": self.take_profit_price,
+            "exit_price": self.exit_price,
+            "exit_reason": self.exit_reason,
+            "pnl_pct": self.pnl_pct,
+            "scaled_pnl_pct": self.scaled_pnl_pct,
+            "r_multiple": self.r_multiple,
+            "position_size_multiplier": self.position_size_multiplier,
+            "base_notional_usdc": self.base_notional_usdc,
+            "effective_notional_usdc": self.effective_notional_usdc,
+            "holding_bars": self.holding_bars,
+            "entry_regime": dict(self.entry_regime) if self.entry_regime is not None else None,
+            "execution_model_id": self.execution_model_id,
+            "execution_seed": self.execution_seed,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestSummary:
     total_bars: int
     decision_enter_count: int
@@ -58,7 +76,25 @@ class BacktestSummary:
     execution_seed: int | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "total_bars": self.total_bars,
+            "decision_enter_count": self.decision_enter_count,
+            "decision_no_signal_count": self.decision_no_signal_count,
+            "closed_trades": self.closed_trades,
+            "open_trades": self.open_trades,
+            "wins": self.wins,
+            "losses": self.losses,
+            "win_rate_pct": self.win_rate_pct,
+            "average_pnl_pct": self.average_pnl_pct,
+            "total_pnl_pct": self.total_pnl_pct,
+            "average_scaled_pnl_pct": self.average_scaled_pnl_pct,
+            "total_scaled_pnl_pct": self.total_scaled_pnl_pct,
+            "average_r_multiple": self.average_r_multiple,
+            "first_bar_close_time": self.first_bar_close_time,
+            "last_bar_close_time": self.last_bar_close_time,
+            "execution_model_id": self.execution_model_id,
+            "execution_seed": self.execution_seed,
+        }
 
 
 @dataclass
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-import importlib
+import copy
+from functools import lru_cache
 import json
 from pathlib import Path
 from typing import Any
@@ -38,19 +39,25 @@ def _normalize_gmo_config_for_research(config: dict[str, Any]) -> dict[str, Any]
     }
 
 
-def load_bot_config(path: str | Path) -> dict[str, Any]:
+@lru_cache(maxsize=128)
+def _load_bot_config_cached(path: str, mtime_ns: int) -> dict[str, Any]:
     source = Path(path)
-    if not source.exists():
-        raise FileNotFoundError(f"Config file not found: {source}")
-
     raw = json.loads(source.read_text(encoding="utf-8"))
     if not isinstance(raw, dict):
         raise ValueError(f"Config payload must be object: {source}")
 
     broker = raw.get("broker")
     if broker == "GMO_COIN":
-        latest_schema = importlib.reload(gmo_schema_module)
-        return _normalize_gmo_config_for_research(latest_schema.parse_config(raw))
+        return _normalize_gmo_config_for_research(gmo_schema_module.parse_config(raw))
+
+    return dex_schema_module.parse_config(raw)
+
+
+def load_bot_config(path: str | Path) -> dict[str, Any]:
+    source = Path(path)
+    if not source.exists():
+        raise FileNotFoundError(f"Config file not found: {source}")
 
-    latest_schema = importlib.reload(dex_schema_module)
-    return latest_schema.parse_config(raw)
+    # Sweeps load the same file many times; the parse is cached per mtime and
+    # each caller gets its own copy to mutate.
+    return copy.deepcopy(_load_bot_config_cached(str(source), source.stat().st_mtime_ns))
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from research.src.store.lineage import build_run_id, capture_git_sha, now_utc_iso
+from research.src.store.lineage import build_run_id, capture_git_dirty, capture_git_sha, now_utc_iso
 from research.src.store.trial_store import TrialStore, flatten_trial_row
 
-__all__ = ["TrialStore", "build_run_id", "capture_git_sha", "flatten_trial_row", "now_utc_iso"]
+__all__ = ["TrialStore", "build_run_id", "capture_git_dirty", "capture_git_sha", "flatten_trial_row", "now_utc_iso"]
@@ -34,6 +34,21 @@ def capture_git_sha() -> str | None:
     return sha or None
 
 
+def capture_git_dirty(*paths: str) -> bool | None:
+    """Whether tracked or untracked files under ``paths`` differ from HEAD; None when git is unavailable."""
+    try:
+        result = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=all", "--", *paths],
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=3,
+        )
+    except Exception:
+        return None
+    return bool(result.stdout.strip())
+
+
 def build_run_id(spec_name: str, *, git_sha: str | None = None, now: datetime | None = None) -> str:
     suffix = (git_sha or "nogit")[:7]
     return f"{timestamp_token(now)}-{slugify(spec_name)}-{suffix}"
@@ -8,8 +8,17 @@ from hashlib import scrypt
 from pathlib import Path
 
 import base58
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-from solders.keypair import Keypair
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+
+# scrypt cost for new wallet files. n=2**17 needs ~128 MiB, above hashlib's
+# 32 MiB default maxmem. The parameters are written into the file so the bot
+# can decrypt both these and older n=2**14 files.
+SCRYPT_N = 2**17
+SCRYPT_R = 8
+SCRYPT_P = 1
+SCRYPT_MAXMEM = 128 * SCRYPT_R * (SCRYPT_N + SCRYPT_P + 2)
 
 
 def parse_args() -> argparse.Namespace:
@@ -44,15 +53,24 @@ def load_secret_key_from_base58(secret_key_base58: str) -> list[int]:
     if len(decoded) == 64:
         return list(decoded)
     if len(decoded) == 32:
-        keypair = Keypair.from_seed(decoded)
-        return list(bytes(keypair))
+        # A Solana keypair is the ed25519 seed followed by its public key.
+        public_key = Ed25519PrivateKey.from_private_bytes(decoded).public_key()
+        return list(decoded + public_key.public_bytes(Encoding.Raw, PublicFormat.Raw))
     raise ValueError(f"Decoded base58 length must be 32 or 64, got {len(decoded)}")
 
 
 def encrypt_secret_key(secret_key: list[int], passphrase: str) -> dict[str, str | int]:
     salt = os.urandom(16)
     iv = os.urandom(12)
-    key = scrypt(passphrase.encode("utf-8"), salt=salt, n=16384, r=8, p=1, dklen=32)
+    key = scrypt(
+        passphrase.encode("utf-8"),
+        salt=salt,
+        n=SCRYPT_N,
+        r=SCRYPT_R,
+        p=SCRYPT_P,
+        maxmem=SCRYPT_MAXMEM,
+        dklen=32,
+    )
     aes = AESGCM(key)
     plaintext = json.dumps(secret_key).encode("utf-8")
     encrypted = aes.encrypt(iv, plaintext, None)
@@ -63,6 +81,9 @@ def encrypt_secret_key(secret_key: list[int], passphrase: str) -> dict[str, str
         "version": 1,
         "algorithm": "aes-256-gcm",
         "kdf": "scrypt",
+        "scrypt_n": SCRYPT_N,
+        "scrypt_r": SCRYPT_R,
+        "scrypt_p": SCRYPT_P,
         "salt_base64": base64.b64encode(salt).decode("utf-8"),
         "iv_base64": base64.b64encode(iv).decode("utf-8"),
         "auth_tag_base64": base64.b64encode(auth_tag).decode("utf-8"),
@@ -79,7 +100,8 @@ def main() -> int:
 
     encrypted = encrypt_secret_key(secret_key, args.passphrase)
     output_path = Path(args.output)
-    output_path.write_text(json.dumps(encrypted, indent=2), encoding="utf-8")
+    with output_path.open("w", encoding="utf-8") as handle:
+        json.dump(encrypted, handle, indent=2)
     print(f"Encrypted wallet saved to {output_path}")
     return 0
 
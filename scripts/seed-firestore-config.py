@@ -6,7 +6,7 @@ import os
 import sys
 from pathlib import Path
 
-from google.cloud.firestore import Client
+from google.cloud.firestore import Client, WriteBatch
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
@@ -224,29 +224,20 @@ def _build_model_doc_payload(
     return payload
 
 
-def seed_global_control_defaults(firestore: Client) -> bool:
+def seed_global_control_defaults(firestore: Client, *, batch: WriteBatch | None = None) -> bool:
     control_ref = firestore.collection(GLOBAL_CONTROL_COLLECTION_ID).document(GLOBAL_CONTROL_DOC_ID)
     snapshot = control_ref.get()
-    if not snapshot.exists:
-        control_ref.set(
-            {
-                GLOBAL_CONTROL_PAUSE_FIELD: False,
-            },
-            merge=True,
-        )
-        return True
-
-    payload = snapshot.to_dict()
-    if not isinstance(payload, dict) or not isinstance(payload.get(GLOBAL_CONTROL_PAUSE_FIELD), bool):
-        control_ref.set(
-            {
-                GLOBAL_CONTROL_PAUSE_FIELD: False,
-            },
-            merge=True,
-        )
-        return True
+    payload = snapshot.to_dict() if snapshot.exists else None
+    if isinstance(payload, dict) and isinstance(payload.get(GLOBAL_CONTROL_PAUSE_FIELD), bool):
+        return False
 
-    return False
+    # The read stays: an operator's existing pause flag must survive a re-seed.
+    # The write rides on the caller's model batch when there is one.
+    if batch is None:
+        control_ref.set({GLOBAL_CONTROL_PAUSE_FIELD: False}, merge=True)
+    else:
+        batch.set(control_ref, {GLOBAL_CONTROL_PAUSE_FIELD: False}, merge=True)
+    return True
 
 
 def _build_model_config_payload(config: BotConfig) -> dict:
@@ -269,10 +260,17 @@ def seed_model_config(
     model_id: str,
     config: BotConfig,
     wallet_key_path: str | None = None,
+    *,
+    batch: WriteBatch | None = None,
 ) -> None:
+    # Both docs go out in one commit; callers seeding several models pass a
+    # shared batch and commit it themselves.
+    writes = batch if batch is not None else firestore.batch()
     model_ref = firestore.document(f"models/{model_id}")
-    model_ref.set(_build_model_doc_payload(model_id, config, wallet_key_path), merge=True)
-    model_ref.collection("config").document("current").set(_build_model_config_payload(config))
+    writes.set(model_ref, _build_model_doc_payload(model_id, config, wallet_key_path), merge=True)
+    writes.set(model_ref.collection("config").document("current"), _build_model_config_payload(config))
+    if batch is None:
+        writes.commit()
 
 
 def main() -> int:
@@ -282,11 +280,13 @@ def main() -> int:
         raise RuntimeError("GOOGLE_APPLICATION_CREDENTIALS is required")
 
     firestore = Client.from_service_account_json(credentials_path)
-    seeded_control = seed_global_control_defaults(firestore)
     if args.control_only:
+        seeded_control = seed_global_control_defaults(firestore)
         print(f"Seeded global control defaults (global_control_seeded={seeded_control})")
         return 0
 
+    batch = firestore.batch()
+    seeded_control = seed_global_control_defaults(firestore, batch=batch)
     if args.config_path:
         model_id, config = load_single_model_config(args.config_path, args.model_id)
         seed_model_config(
@@ -294,7 +294,9 @@ def main() -> int:
             model_id,
             config,
             wallet_key_path=args.wallet_key_path,
+            batch=batch,
         )
+        batch.commit()
         print(
             "Seeded Firestore model config "
             f"(model_id={model_id}, mode={config['execution']['mode']}, wallet_key_path={args.wallet_key_path}) "
@@ -304,8 +306,9 @@ def main() -> int:
 
     seeded_model_ids: list[str] = []
     for model_id, config in build_default_model_configs(args.mode).items():
-        seed_model_config(firestore, model_id, config, wallet_key_path=args.wallet_key_path)
+        seed_model_config(firestore, model_id, config, wallet_key_path=args.wallet_key_path, batch=batch)
         seeded_model_ids.append(model_id)
+    batch.commit()
 
     print(
         "Seeded Firestore model configs "
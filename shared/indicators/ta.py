@@ -8,7 +8,7 @@ def _is_valid_period(period: int) -> bool:
 
 
 def _is_finite_series(values: list[float]) -> bool:
-    return all(math.isfinite(value) for value in values)
+    return all(map(math.isfinite, values))
 
 
 def ema_series(closes: list[float], period: int) -> list[float]:
@@ -18,12 +18,13 @@ def ema_series(closes: list[float], period: int) -> list[float]:
         return []
 
     k = 2 / (period + 1)
+    decay = 1 - k
     seed = sum(closes[:period]) / period
     values: list[float] = [seed]
 
     ema = seed
     for close in closes[period:]:
-        ema = close * k + ema * (1 - k)
+        ema = close * k + ema * decay
         values.append(ema)
 
     return values
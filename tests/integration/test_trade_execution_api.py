@@ -3,12 +3,11 @@ from __future__ import annotations
 import json
 import threading
 import unittest
-from copy import deepcopy
 from dataclasses import dataclass
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any, Callable
 from unittest.mock import patch
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qs
 
 from solders.keypair import Keypair
 
@@ -45,7 +44,7 @@ class InMemoryLogger:
 
 class InMemoryLock:
     def __init__(self) -> None:
-        self.inflight: dict[str, int] = {}
+        self.inflight: set[str] = set()
         self.entry: set[str] = set()
         self.locked = False
 
@@ -73,13 +72,24 @@ class InMemoryLock:
         self.entry.discard(bar_close_time_iso)
 
     def set_inflight_tx(self, signature: str, ttl_seconds: int) -> None:
-        self.inflight[signature] = ttl_seconds
+        _ = ttl_seconds
+        self.inflight.add(signature)
 
     def has_inflight_tx(self, signature: str) -> bool:
         return signature in self.inflight
 
     def clear_inflight_tx(self, signature: str) -> None:
-        self.inflight.pop(signature, None)
+        self.inflight.discard(signature)
+
+
+def _clone(value: Any) -> Any:
+    # Records are plain JSON-shaped data, so only dicts and lists need copying.
+    value_type = type(value)
+    if value_type is dict:
+        return {key: _clone(item) for key, item in value.items()}
+    if value_type is list:
+        return [_clone(item) for item in value]
+    return value
 
 
 def _merge(dst: dict[str, Any], src: dict[str, Any]) -> None:
@@ -87,7 +97,7 @@ def _merge(dst: dict[str, Any], src: dict[str, Any]) -> None:
         if isinstance(value, dict) and isinstance(dst.get(key), dict):
             _merge(dst[key], value)
             continue
-        dst[key] = deepcopy(value)
+        dst[key] = _clone(value)
 
 
 class InMemoryPersistence:
@@ -100,7 +110,7 @@ class InMemoryPersistence:
         return self.config
 
     def create_trade(self, trade: TradeRecord) -> None:
-        self.trades[trade["trade_id"]] = deepcopy(trade)
+        self.trades[trade["trade_id"]] = _clone(trade)
 
     def update_trade(self, trade_id: str, updates: dict[str, Any]) -> None:
         current = self.trades.get(trade_id)
@@ -109,15 +119,15 @@ class InMemoryPersistence:
         _merge(current, updates)
 
     def find_open_trade(self, pair: Pair) -> TradeRecord | None:
-        candidates = [
-            trade
-            for trade in self.trades.values()
-            if trade.get("pair") == pair and trade.get("state") == "CONFIRMED"
-        ]
-        if not candidates:
-            return None
-        candidates.sort(key=lambda item: item.get("created_at", ""), reverse=True)
-        return candidates[0]
+        return max(
+            (
+                trade
+                for trade in self.trades.values()
+                if trade.get("pair") == pair and trade.get("state") == "CONFIRMED"
+            ),
+            key=lambda item: item.get("created_at", ""),
+            default=None,
+        )
 
     def count_trades_for_utc_day(self, pair: Pair, day_start_iso: str, day_end_iso: str) -> int:
         _ = pair
@@ -126,7 +136,7 @@ class InMemoryPersistence:
         return 0
 
     def save_run(self, run: RunRecord) -> None:
-        self.runs[run["run_id"]] = deepcopy(run)
+        self.runs[run["run_id"]] = _clone(run)
 
 
 class FakeSolanaSender:
@@ -134,9 +144,10 @@ class FakeSolanaSender:
         self.sent: list[str] = []
         self.confirmed: list[str] = []
         self._counter = 0
+        self._public_key = str(Keypair().pubkey())
 
     def get_public_key_base58(self) -> str:
-        return str(Keypair().pubkey())
+        return self._public_key
 
     def send_versioned_transaction_base64(self, serialized_base64: str) -> str:
         self.sent.append(serialized_base64)
@@ -173,8 +184,9 @@ class MockServer:
 
         class Handler(BaseHTTPRequestHandler):
             def _handle(self) -> None:
-                parsed = urlparse(self.path)
-                query = parse_qs(parsed.query)
+                # Request targets are origin-form paths, so no full URL parse is needed.
+                path, _, query_string = self.path.partition("?")
+                query = parse_qs(query_string)
                 body_raw = b""
                 body_json: dict[str, Any] | None = None
                 if self.command == "POST":
@@ -185,12 +197,12 @@ class MockServer:
                 requests_log.append(
                     {
                         "method": self.command,
-                        "path": parsed.path,
+                        "path": path,
                         "query": query,
                         "body_json": body_json,
                     }
                 )
-                status, payload = responder(self.command, parsed.path, query, body_json)
+                status, payload = responder(self.command, path, query, body_json)
                 encoded = json.dumps(payload).encode("utf-8")
                 self.send_response(status)
                 self.send_header("Content-Type", "application/json")
@@ -209,7 +221,10 @@ class MockServer:
                 _ = args
 
         self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
-        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        # Handler threads are daemons; server_close() need not join them.
+        self.httpd.block_on_close = False
+        # shutdown() waits for the next poll, so keep it short.
+        self.thread = threading.Thread(target=self.httpd.serve_forever, args=(0.01,), daemon=True)
         self.thread.start()
         return self
 
@@ -228,41 +243,50 @@ class MockServer:
         return f"http://{host}:{port}"
 
 
+_CONFIG_TEMPLATE: BotConfig = {
+    "enabled": True,
+    "network": "mainnet-beta",
+    "pair": "SOL/USDC",
+    "direction": "LONG",
+    "signal_timeframe": "2h",
+    "strategy": {
+        "name": "ema_trend_pullback_v0",
+        "ema_fast_period": 12,
+        "ema_slow_period": 34,
+        "swing_low_lookback_bars": 12,
+        "entry": "ON_BAR_CLOSE",
+    },
+    "risk": {
+        "max_loss_per_trade_pct": 0.5,
+        "max_trades_per_day": 1,
+        "volatile_atr_pct_threshold": 1.3,
+        "storm_atr_pct_threshold": 1.4,
+        "volatile_size_multiplier": 0.75,
+        "storm_size_multiplier": 0.5,
+    },
+    "execution": {
+        "mode": "LIVE",
+        "swap_provider": "JUPITER",
+        "slippage_bps": 50,
+        "min_notional_usdc": 50,
+        "only_direct_routes": False,
+    },
+    "exit": {"stop": "SWING_LOW", "take_profit_r_multiple": 1.5},
+    "meta": {"config_version": 2, "note": "test"},
+}
+
+
 def _build_config() -> BotConfig:
-    return {
-        "enabled": True,
-        "network": "mainnet-beta",
-        "pair": "SOL/USDC",
-        "direction": "LONG",
-        "signal_timeframe": "2h",
-        "strategy": {
-            "name": "ema_trend_pullback_v0",
-            "ema_fast_period": 12,
-            "ema_slow_period": 34,
-            "swing_low_lookback_bars": 12,
-            "entry": "ON_BAR_CLOSE",
-        },
-        "risk": {
-            "max_loss_per_trade_pct": 0.5,
-            "max_trades_per_day": 1,
-            "volatile_atr_pct_threshold": 1.3,
-            "storm_atr_pct_threshold": 1.4,
-            "volatile_size_multiplier": 0.75,
-            "storm_size_multiplier": 0.5,
-        },
-        "execution": {
-            "mode": "LIVE",
-            "swap_provider": "JUPITER",
-            "slippage_bps": 50,
-            "min_notional_usdc": 50,
-            "only_direct_routes": False,
-        },
-        "exit": {"stop": "SWING_LOW", "take_profit_r_multiple": 1.5},
-        "meta": {"config_version": 2, "note": "test"},
-    }
+    return _clone(_CONFIG_TEMPLATE)
 
 
 class TradeExecutionApiTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # The usecases and http_retry back off through time.sleep; no test here
+        # asserts on real delays.
+        cls.enterClassContext(patch("time.sleep", return_value=None))
+
     def test_open_position_is_canceled_when_multiplier_is_zero(self) -> None:
         def responder(
             method: str,
@@ -707,21 +731,20 @@ class TradeExecutionApiTest(unittest.TestCase):
                 return 1.0
 
         execution = RetryEntryExecution()
-        with patch("apps.dex_bot.app.usecases.open_position.time.sleep", return_value=None):
-            opened = open_position(
-                OpenPositionDependencies(
-                    execution=execution,
-                    lock=lock,
-                    logger=logger,
-                    persistence=persistence,
-                ),
-                OpenPositionInput(
-                    config=config,
-                    signal=signal,
-                    bar_close_time_iso="2026-02-21T10:00:00.000Z",
-                    model_id="ema_pullback_2h_long_v0",
-                ),
-            )
+        opened = open_position(
+            OpenPositionDependencies(
+                execution=execution,
+                lock=lock,
+                logger=logger,
+                persistence=persistence,
+            ),
+            OpenPositionInput(
+                config=config,
+                signal=signal,
+                bar_close_time_iso="2026-02-21T10:00:00.000Z",
+                model_id="ema_pullback_2h_long_v0",
+            ),
+        )
 
         self.assertEqual("OPENED", opened.status)
         self.assertEqual(3, execution.submit_calls)
@@ -772,21 +795,20 @@ class TradeExecutionApiTest(unittest.TestCase):
                 return 1.0
 
         execution = NonRetriableEntryExecution()
-        with patch("apps.dex_bot.app.usecases.open_position.time.sleep", return_value=None):
-            opened = open_position(
-                OpenPositionDependencies(
-                    execution=execution,
-                    lock=lock,
-                    logger=logger,
-                    persistence=persistence,
-                ),
-                OpenPositionInput(
-                    config=config,
-                    signal=signal,
-                    bar_close_time_iso="2026-02-21T10:00:00.000Z",
-                    model_id="ema_pullback_2h_long_v0",
-                ),
-            )
+        opened = open_position(
+            OpenPositionDependencies(
+                execution=execution,
+                lock=lock,
+                logger=logger,
+                persistence=persistence,
+            ),
+            OpenPositionInput(
+                config=config,
+                signal=signal,
+                bar_close_time_iso="2026-02-21T10:00:00.000Z",
+                model_id="ema_pullback_2h_long_v0",
+            ),
+        )
 
         self.assertEqual("SKIPPED", opened.status)
         self.assertEqual(1, execution.submit_calls)
@@ -841,21 +863,20 @@ class TradeExecutionApiTest(unittest.TestCase):
                 return 1.0
 
         execution = SlippageExecution()
-        with patch("apps.dex_bot.app.usecases.open_position.time.sleep", return_value=None):
-            opened = open_position(
-                OpenPositionDependencies(
-                    execution=execution,
-                    lock=lock,
-                    logger=logger,
-                    persistence=persistence,
-                ),
-                OpenPositionInput(
-                    config=config,
-                    signal=signal,
-                    bar_close_time_iso="2026-02-21T10:00:00.000Z",
-                    model_id="ema_pullback_2h_long_v0",
-                ),
-            )
+        opened = open_position(
+            OpenPositionDependencies(
+                execution=execution,
+                lock=lock,
+                logger=logger,
+                persistence=persistence,
+            ),
+            OpenPositionInput(
+                config=config,
+                signal=signal,
+                bar_close_time_iso="2026-02-21T10:00:00.000Z",
+                model_id="ema_pullback_2h_long_v0",
+            ),
+        )
 
         self.assertEqual("SKIPPED", opened.status)
         self.assertEqual(3, execution.submit_calls)
@@ -914,21 +935,20 @@ class TradeExecutionApiTest(unittest.TestCase):
                 return 1.0
 
         execution = ExactOutMismatchExecution()
-        with patch("apps.dex_bot.app.usecases.open_position.time.sleep", return_value=None):
-            opened = open_position(
-                OpenPositionDependencies(
-                    execution=execution,
-                    lock=lock,
-                    logger=logger,
-                    persistence=persistence,
-                ),
-                OpenPositionInput(
-                    config=config,
-                    signal=signal,
-                    bar_close_time_iso="2026-02-21T10:00:00.000Z",
-                    model_id="ema_pullback_2h_long_v0",
-                ),
-            )
+        opened = open_position(
+            OpenPositionDependencies(
+                execution=execution,
+                lock=lock,
+                logger=logger,
+                persistence=persistence,
+            ),
+            OpenPositionInput(
+                config=config,
+                signal=signal,
+                bar_close_time_iso="2026-02-21T10:00:00.000Z",
+                model_id="ema_pullback_2h_long_v0",
+            ),
+        )
 
         self.assertEqual("SKIPPED", opened.status)
         self.assertEqual(3, execution.submit_calls)
@@ -1018,6 +1038,84 @@ class TradeExecutionApiTest(unittest.TestCase):
         self.assertEqual(199.987654, float(trade["position"]["quote_amount_usdc"]))
         self.assertEqual(1.999876543, float(trade["position"]["quantity_sol"]))
 
+    def test_open_position_uses_combined_balance_snapshot_when_supported(self) -> None:
+        config = _build_config()
+        persistence = InMemoryPersistence(config)
+
+        signal = EntrySignalDecision(
+            type="ENTER",
+            summary="combined balance snapshot long",
+            ema_fast=101.0,
+            ema_slow=100.0,
+            entry_price=100.0,
+            stop_price=98.0,
+            take_profit_price=103.0,
+        )
+
+        class CombinedBalanceExecution:
+            def __init__(self) -> None:
+                self.snapshots = [(200.0, 1.0), (0.012346, 2.999876543)]
+                self.snapshot_calls = 0
+
+            def submit_swap(self, request: Any) -> SwapSubmission:
+                _ = request
+                return SwapSubmission(
+                    tx_signature="entry_sig_combined_balance",
+                    in_amount_atomic=200_000_000,
+                    out_amount_atomic=2_000_000_000,
+                    order={"tx_signature": "entry_sig_combined_balance"},
+                    result={
+                        "status": "ESTIMATED",
+                        "avg_fill_price": 100.0,
+                        "spent_quote_usdc": 200.0,
+                        "filled_base_sol": 2.0,
+                    },
+                )
+
+            def confirm_swap(self, tx_signature: str, timeout_ms: int) -> SwapConfirmation:
+                _ = tx_signature
+                _ = timeout_ms
+                return SwapConfirmation(confirmed=True)
+
+            def get_mark_price(self, pair: str) -> float:
+                _ = pair
+                return 100.0
+
+            def get_available_quote_usdc(self, pair: str) -> float:
+                _ = pair
+                return 200.0
+
+            def get_available_base_sol(self, pair: str) -> float:
+                _ = pair
+                raise AssertionError("snapshot must use get_available_balances")
+
+            def get_available_balances(self, pair: str) -> tuple[float, float]:
+                _ = pair
+                self.snapshot_calls += 1
+                return self.snapshots.pop(0)
+
+        execution = CombinedBalanceExecution()
+        opened = open_position(
+            OpenPositionDependencies(
+                execution=execution,
+                lock=InMemoryLock(),
+                logger=InMemoryLogger(),
+                persistence=persistence,
+            ),
+            OpenPositionInput(
+                config=config,
+                signal=signal,
+                bar_close_time_iso="2026-02-21T10:00:00.000Z",
+                model_id="ema_pullback_2h_long_v0",
+            ),
+        )
+
+        self.assertEqual("OPENED", opened.status)
+        self.assertEqual(2, execution.snapshot_calls)
+        trade = persistence.trades[opened.trade_id]
+        self.assertEqual(199.987654, float(trade["position"]["quote_amount_usdc"]))
+        self.assertEqual(1.999876543, float(trade["position"]["quantity_sol"]))
+
     def test_open_position_prefers_balance_snapshot_for_short_quote_amount(self) -> None:
         config = _build_config()
         config["direction"] = "SHORT"
@@ -1417,6 +1515,95 @@ class TradeExecutionApiTest(unittest.TestCase):
         closed_trade = persistence.trades[trade["trade_id"]]
         self.assertEqual(12_000, closed_trade["execution"]["exit_fee_lamports"])
 
+    def test_close_position_uses_combined_balance_snapshot_when_supported(self) -> None:
+        config = _build_config()
+        persistence = InMemoryPersistence(config)
+
+        trade: TradeRecord = {
+            "trade_id": "2026-02-22T21:00:00Z_ema_pullback_2h_long_v0_LONG",
+            "model_id": "ema_pullback_2h_long_v0",
+            "bar_close_time_iso": "2026-02-22T21:00:00Z",
+            "pair": "SOL/USDC",
+            "direction": "LONG",
+            "state": "CONFIRMED",
+            "config_version": 2,
+            "execution": {"entry_tx_signature": "entry_sig_1"},
+            "position": {
+                "status": "OPEN",
+                "quantity_sol": 0.5,
+                "entry_price": 80.0,
+                "stop_price": 78.0,
+                "take_profit_price": 84.0,
+                "entry_time_iso": "2026-02-22T21:01:00Z",
+            },
+            "created_at": "2026-02-22T21:01:00Z",
+            "updated_at": "2026-02-22T21:01:00Z",
+        }
+        persistence.create_trade(trade)
+        stored_trade = persistence.trades[trade["trade_id"]]
+
+        class CombinedBalanceExecution:
+            def __init__(self) -> None:
+                self.snapshots = [(100.0, 1.0), (139.5, 0.5)]
+
+            def submit_swap(self, request: Any) -> SwapSubmission:
+                _ = request
+                return SwapSubmission(
+                    tx_signature="exit_sig_combined_balance",
+                    in_amount_atomic=500_000_000,
+                    out_amount_atomic=40_000_000,
+                    order={"tx_signature": "exit_sig_combined_balance"},
+                    result={
+                        "status": "ESTIMATED",
+                        "avg_fill_price": 80.0,
+                        "spent_quote_usdc": 40.0,
+                        "filled_base_sol": 0.5,
+                    },
+                )
+
+            def confirm_swap(self, tx_signature: str, timeout_ms: int) -> SwapConfirmation:
+                _ = tx_signature
+                _ = timeout_ms
+                return SwapConfirmation(confirmed=True)
+
+            def get_mark_price(self, pair: str) -> float:
+                _ = pair
+                return 77.5
+
+            def get_available_quote_usdc(self, pair: str) -> float:
+                _ = pair
+                raise AssertionError("snapshot must use get_available_balances")
+
+            def get_available_base_sol(self, pair: str) -> float:
+                _ = pair
+                raise AssertionError("snapshot must use get_available_balances")
+
+            def get_available_balances(self, pair: str) -> tuple[float, float]:
+                _ = pair
+                return self.snapshots.pop(0)
+
+        execution = CombinedBalanceExecution()
+        closed = close_position(
+            ClosePositionDependencies(
+                execution=execution,
+                lock=InMemoryLock(),
+                logger=InMemoryLogger(),
+                persistence=persistence,
+            ),
+            ClosePositionInput(
+                config=config,
+                trade=stored_trade,
+                close_reason="STOP_LOSS",
+                close_price=77.5,
+            ),
+        )
+
+        self.assertEqual("CLOSED", closed.status)
+        self.assertEqual([], execution.snapshots)
+        closed_trade = persistence.trades[trade["trade_id"]]
+        self.assertEqual(39.5, closed_trade["execution"]["exit_result"]["exit_quote_usdc"])
+        self.assertEqual(79.0, closed_trade["position"]["exit_price"])
+
     def test_submit_swap_retries_quote_and_swap_http_503(self) -> None:
         quote_count = 0
         swap_count = 0
@@ -1450,9 +1637,6 @@ class TradeExecutionApiTest(unittest.TestCase):
             with patch("apps.dex_bot.adapters.execution.jupiter_quote_client.QUOTE_API_URL", quote_url), patch(
                 "apps.dex_bot.adapters.execution.jupiter_swap.SWAP_API_URL",
                 swap_url,
-            ), patch(
-                "apps.dex_bot.adapters.execution.http_retry.time.sleep",
-                return_value=None,
             ):
                 submission = adapter.submit_swap(
                     SubmitSwapRequest(
@@ -1470,6 +1654,16 @@ class TradeExecutionApiTest(unittest.TestCase):
 
 
 class SolanaSenderRpcMethodTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.enterClassContext(patch("time.sleep", return_value=None))
+        cls.enterClassContext(
+            patch(
+                "apps.dex_bot.adapters.execution.solana_sender._decrypt_secret_key",
+                return_value=bytes(Keypair()),
+            )
+        )
+
     def test_rpc_retries_on_http_503_then_succeeds(self) -> None:
         request_count = 0
 
@@ -1489,22 +1683,97 @@ class SolanaSenderRpcMethodTest(unittest.TestCase):
             return 404, {"error": "not found"}
 
         with MockServer(responder) as server:
-            fake_secret = bytes(Keypair())
-            with patch(
-                "apps.dex_bot.adapters.execution.solana_sender._decrypt_secret_key",
-                return_value=fake_secret,
-            ), patch("apps.dex_bot.adapters.execution.solana_sender.time.sleep", return_value=None):
-                sender = SolanaSender(
-                    rpc_url=f"{server.base_url}/rpc",
-                    wallet_key_path="unused",
-                    wallet_passphrase="unused",
-                    logger=InMemoryLogger(),
-                )
-                balance = sender.get_native_sol_balance_ui_amount()
+            sender = SolanaSender(
+                rpc_url=f"{server.base_url}/rpc",
+                wallet_key_path="unused",
+                wallet_passphrase="unused",
+                logger=InMemoryLogger(),
+            )
+            balance = sender.get_native_sol_balance_ui_amount()
 
         self.assertEqual(2.0, balance)
         self.assertEqual(2, request_count)
 
+    def test_wallet_balances_are_fetched_in_one_batch_request(self) -> None:
+        batches: list[list[str]] = []
+
+        def responder(
+            method: str,
+            path: str,
+            query: dict[str, list[str]],
+            body_json: Any,
+        ) -> tuple[int, Any]:
+            _ = query
+            if method == "POST" and path == "/rpc" and isinstance(body_json, list):
+                batches.append([request["method"] for request in body_json])
+                results = {
+                    "getTokenAccountsByOwner": {
+                        "value": [
+                            {"account": {"data": {"parsed": {"info": {"tokenAmount": {"uiAmount": 12.5}}}}}},
+                            {"account": {"data": {"parsed": {"info": {"tokenAmount": {"amount": "500000", "decimals": 6}}}}}},
+                        ]
+                    },
+                    "getBalance": {"value": 1_500_000_000},
+                }
+                # Reply out of order to exercise id matching.
+                return 200, [
+                    {"jsonrpc": "2.0", "id": request["id"], "result": results[request["method"]]}
+                    for request in reversed(body_json)
+                ]
+            return 404, {"error": "not found"}
+
+        with MockServer(responder) as server:
+            sender = SolanaSender(
+                rpc_url=f"{server.base_url}/rpc",
+                wallet_key_path="unused",
+                wallet_passphrase="unused",
+                logger=InMemoryLogger(),
+            )
+            balances = sender.get_wallet_balances_ui_amount(USDC_MINT)
+
+        self.assertEqual((13.0, 1.5), balances)
+        self.assertEqual([["getTokenAccountsByOwner", "getBalance"]], batches)
+
+    def test_available_balances_fall_back_to_single_calls_when_batch_is_rejected(self) -> None:
+        single_methods: list[str] = []
+
+        def responder(
+            method: str,
+            path: str,
+            query: dict[str, list[str]],
+            body_json: Any,
+        ) -> tuple[int, Any]:
+            _ = query
+            if method != "POST" or path != "/rpc":
+                return 404, {"error": "not found"}
+            if isinstance(body_json, list):
+                return 200, {
+                    "jsonrpc": "2.0",
+                    "id": None,
+                    "error": {"code": -32600, "message": "batch requests disabled"},
+                }
+            single_methods.append(body_json["method"])
+            if body_json["method"] == "getBalance":
+                return 200, {"jsonrpc": "2.0", "id": 1, "result": {"value": 250_000_000}}
+            return 200, {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "result": {"value": [{"account": {"data": {"parsed": {"info": {"tokenAmount": {"uiAmount": 42.0}}}}}}]},
+            }
+
+        with MockServer(responder) as server:
+            sender = SolanaSender(
+                rpc_url=f"{server.base_url}/rpc",
+                wallet_key_path="unused",
+                wallet_passphrase="unused",
+                logger=InMemoryLogger(),
+            )
+            adapter = JupiterSwapAdapter(JupiterQuoteClient(), sender, InMemoryLogger())
+            balances = adapter.get_available_balances("SOL/USDC")
+
+        self.assertEqual((42.0, 0.25), balances)
+        self.assertEqual(["getTokenAccountsByOwner", "getBalance"], single_methods)
+
     def test_send_versioned_transaction_uses_send_transaction_rpc_method(self) -> None:
         def responder(
             method: str,
@@ -1543,11 +1812,7 @@ class SolanaSenderRpcMethodTest(unittest.TestCase):
                 return SignedTx()
 
         with MockServer(responder) as server:
-            fake_secret = bytes(Keypair())
             with patch(
-                "apps.dex_bot.adapters.execution.solana_sender._decrypt_secret_key",
-                return_value=fake_secret,
-            ), patch(
                 "apps.dex_bot.adapters.execution.solana_sender.VersionedTransaction",
                 DummyVersionedTransaction,
             ), patch(
@@ -1592,18 +1857,13 @@ class SolanaSenderRpcMethodTest(unittest.TestCase):
             return 404, {"error": "not found"}
 
         with MockServer(responder) as server:
-            fake_secret = bytes(Keypair())
-            with patch(
-                "apps.dex_bot.adapters.execution.solana_sender._decrypt_secret_key",
-                return_value=fake_secret,
-            ):
-                sender = SolanaSender(
-                    rpc_url=f"{server.base_url}/rpc",
-                    wallet_key_path="unused",
-                    wallet_passphrase="unused",
-                    logger=InMemoryLogger(),
-                )
-                fee = sender.get_transaction_fee_lamports("sig-1")
+            sender = SolanaSender(
+                rpc_url=f"{server.base_url}/rpc",
+                wallet_key_path="unused",
+                wallet_passphrase="unused",
+                logger=InMemoryLogger(),
+            )
+            fee = sender.get_transaction_fee_lamports("sig-1")
 
         self.assertEqual(9_400, fee)
 
@@ -1625,18 +1885,13 @@ class SolanaSenderRpcMethodTest(unittest.TestCase):
             return 404, {"error": "not found"}
 
         with MockServer(responder) as server:
-            fake_secret = bytes(Keypair())
-            with patch(
-                "apps.dex_bot.adapters.execution.solana_sender._decrypt_secret_key",
-                return_value=fake_secret,
-            ):
-                sender = SolanaSender(
-                    rpc_url=f"{server.base_url}/rpc",
-                    wallet_key_path="unused",
-                    wallet_passphrase="unused",
-                    logger=InMemoryLogger(),
-                )
-                fee = sender.get_transaction_fee_lamports("sig-1")
+            sender = SolanaSender(
+                rpc_url=f"{server.base_url}/rpc",
+                wallet_key_path="unused",
+                wallet_passphrase="unused",
+                logger=InMemoryLogger(),
+            )
+            fee = sender.get_transaction_fee_lamports("sig-1")
 
         self.assertIsNone(fee)
 
@@ -1664,18 +1919,13 @@ class SolanaSenderRpcMethodTest(unittest.TestCase):
             return 404, {"error": "not found"}
 
         with MockServer(responder) as server:
-            fake_secret = bytes(Keypair())
-            with patch(
-                "apps.dex_bot.adapters.execution.solana_sender._decrypt_secret_key",
-                return_value=fake_secret,
-            ), patch("apps.dex_bot.adapters.execution.solana_sender.time.sleep", return_value=None):
-                sender = SolanaSender(
-                    rpc_url=f"{server.base_url}/rpc",
-                    wallet_key_path="unused",
-                    wallet_passphrase="unused",
-                    logger=InMemoryLogger(),
-                )
-                confirmation = sender.confirm_signature("sig-1", timeout_ms=5_000, poll_interval_ms=10)
+            sender = SolanaSender(
+                rpc_url=f"{server.base_url}/rpc",
+                wallet_key_path="unused",
+                wallet_passphrase="unused",
+                logger=InMemoryLogger(),
+            )
+            confirmation = sender.confirm_signature("sig-1", timeout_ms=5_000, poll_interval_ms=10)
 
         self.assertTrue(confirmation.confirmed)
         self.assertEqual(2, request_count)
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime, timedelta, timezone
 import unittest
 from unittest.mock import patch
 
-from apps.dex_bot.domain.model.types import BotConfig, EntrySignalDecision, OhlcvBar
+from apps.dex_bot.domain.model.types import BotConfig, EntrySignalDecision, NoSignalDecision, OhlcvBar
 from apps.dex_bot.domain.risk.short_regime_guard import SHORT_REGIME_GUARD_REASON
 from apps.dex_bot.domain.risk.short_stop_loss_cooldown import SHORT_STOP_LOSS_COOLDOWN_REASON
-from research.src.domain.backtest_engine import run_backtest
+from research.src.domain.backtest_engine import OHLCV_LIMIT_FOR_15M_UPPER_TREND, run_backtest
 
 
 def _build_config(*, strategy_name: str) -> BotConfig:
@@ -333,6 +333,76 @@ class BacktestEngineDynamicCapTest(unittest.TestCase):
         self.assertEqual(1, report.summary.closed_trades)
         self.assertEqual(1, report.summary.losses)
 
+    def test_daily_cap_resets_at_utc_midnight_for_offset_timestamps(self) -> None:
+        config = _build_config(strategy_name="ema_trend_pullback_v0")
+        config["risk"]["max_trades_per_day"] = 1
+        jst = timezone(timedelta(hours=9))
+        # Closes at 23:30, 23:45, 00:00 and 00:15 UTC, expressed in JST.
+        first_close = datetime(2026, 1, 2, 8, 30, tzinfo=jst)
+        bar_specs = [
+            (100.0, 100.2, 99.8, 100.0),
+            (100.0, 101.0, 98.8, 99.3),
+            (99.3, 100.2, 99.0, 100.0),
+            (100.0, 101.0, 98.7, 99.2),
+        ]
+        bars = [
+            OhlcvBar(
+                open_time=first_close + timedelta(minutes=15 * (index - 1)),
+                close_time=first_close + timedelta(minutes=15 * index),
+                open=open_,
+                high=high,
+                low=low,
+                close=close,
+                volume=1_000.0,
+            )
+            for index, (open_, high, low, close) in enumerate(bar_specs)
+        ]
+
+        with patch(
+            "research.src.domain.backtest_engine.evaluate_strategy_for_model",
+            side_effect=lambda **_: _build_enter_decision(),
+        ):
+            report = run_backtest(bars=bars, config=config)
+
+        self.assertEqual(2, report.summary.decision_enter_count)
+        self.assertNotIn("MAX_TRADES_PER_DAY_REACHED", report.no_signal_reason_counts)
+
+
+class BacktestEngineDecisionWindowTest(unittest.TestCase):
+    def test_strategy_receives_bounded_window_ending_at_current_bar(self) -> None:
+        config = _build_config(strategy_name="ema_trend_pullback_15m_v0")
+        start = datetime(2026, 1, 1, tzinfo=UTC)
+        bar_count = OHLCV_LIMIT_FOR_15M_UPPER_TREND + 100
+        bars = [
+            OhlcvBar(
+                open_time=start + timedelta(minutes=15 * index),
+                close_time=start + timedelta(minutes=15 * (index + 1)),
+                open=100.0,
+                high=100.5,
+                low=99.5,
+                close=100.0,
+                volume=1_000.0,
+            )
+            for index in range(bar_count)
+        ]
+        windows: list[tuple[int, OhlcvBar]] = []
+
+        def _record_window(**kwargs: object) -> NoSignalDecision:
+            window = kwargs["bars"]
+            windows.append((len(window), window[-1]))
+            return NoSignalDecision(type="NO_SIGNAL", summary="none", reason="TEST_NO_SIGNAL")
+
+        with patch(
+            "research.src.domain.backtest_engine.evaluate_strategy_for_model",
+            side_effect=_record_window,
+        ):
+            run_backtest(bars=bars, config=config)
+
+        self.assertEqual(bar_count, len(windows))
+        self.assertEqual(OHLCV_LIMIT_FOR_15M_UPPER_TREND, max(length for length, _ in windows))
+        self.assertEqual([1, 2], [length for length, _ in windows[:2]])
+        self.assertTrue(all(last is bar for (_, last), bar in zip(windows, bars)))
+
 
 if __name__ == "__main__":
     unittest.main()
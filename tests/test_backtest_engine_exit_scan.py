@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+import unittest
+
+from apps.dex_bot.domain.model.types import OhlcvBar
+from research.src.data.bar_columns import OhlcvColumns
+from research.src.domain.backtest_engine import _TOUCH_SCAN_BLOCK_BARS, _first_touch_index
+
+
+def _build_columns(ranges: list[tuple[float, float]]) -> OhlcvColumns:
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    return OhlcvColumns.from_bars(
+        [
+            OhlcvBar(
+                open_time=start + timedelta(minutes=15 * index),
+                close_time=start + timedelta(minutes=15 * (index + 1)),
+                open=(low + high) / 2,
+                high=high,
+                low=low,
+                close=(low + high) / 2,
+                volume=1.0,
+            )
+            for index, (low, high) in enumerate(ranges)
+        ]
+    )
+
+
+class FirstTouchIndexTest(unittest.TestCase):
+    def test_long_finds_first_stop_or_take_profit_touch(self) -> None:
+        columns = _build_columns([(99.0, 101.0), (99.5, 100.5), (98.0, 100.0), (99.0, 103.0)])
+
+        self.assertEqual(2, _first_touch_index(columns, start=1, stop_price=98.0, take_profit_price=103.0, is_long=True))
+        self.assertEqual(3, _first_touch_index(columns, start=1, stop_price=97.0, take_profit_price=103.0, is_long=True))
+        self.assertEqual(4, _first_touch_index(columns, start=1, stop_price=90.0, take_profit_price=110.0, is_long=True))
+
+    def test_short_uses_high_for_stop_and_low_for_take_profit(self) -> None:
+        columns = _build_columns([(99.0, 101.0), (99.5, 102.0), (97.0, 100.0)])
+
+        self.assertEqual(1, _first_touch_index(columns, start=1, stop_price=102.0, take_profit_price=97.0, is_long=False))
+        self.assertEqual(2, _first_touch_index(columns, start=1, stop_price=103.0, take_profit_price=97.0, is_long=False))
+
+    def test_touch_beyond_first_scan_block_is_found(self) -> None:
+        count = _TOUCH_SCAN_BLOCK_BARS * 3
+        ranges = [(99.0, 101.0)] * count
+        ranges[count - 5] = (95.0, 101.0)
+        columns = _build_columns(ranges)
+
+        self.assertEqual(
+            count - 5,
+            _first_touch_index(columns, start=1, stop_price=96.0, take_profit_price=105.0, is_long=True),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+import unittest
+
+from research.src.domain.backtest_types import BacktestSummary, BacktestTrade
+
+
+class BacktestTypesToDictTest(unittest.TestCase):
+    def test_trade_to_dict_matches_asdict_and_copies_regime(self) -> None:
+        trade = BacktestTrade(
+            entry_time="2026-01-01T00:15:00Z",
+            exit_time="2026-01-01T01:00:00Z",
+            entry_price=100.0,
+            stop_price=99.0,
+            take_profit_price=102.0,
+            exit_price=102.0,
+            exit_reason="TAKE_PROFIT",
+            pnl_pct=2.0,
+            scaled_pnl_pct=2.0,
+            r_multiple=2.0,
+            position_size_multiplier=1.0,
+            base_notional_usdc=1000.0,
+            effective_notional_usdc=1000.0,
+            holding_bars=3,
+            entry_regime={"vol": "LOW_VOL"},
+            execution_model_id="ideal_v1",
+        )
+
+        payload = trade.to_dict()
+
+        self.assertEqual(list(asdict(trade).items()), list(payload.items()))
+        self.assertIsNot(trade.entry_regime, payload["entry_regime"])
+
+    def test_summary_to_dict_matches_asdict(self) -> None:
+        summary = BacktestSummary(
+            total_bars=10,
+            decision_enter_count=2,
+            decision_no_signal_count=8,
+            closed_trades=2,
+            open_trades=0,
+            wins=1,
+            losses=1,
+            win_rate_pct=50.0,
+            average_pnl_pct=0.5,
+            total_pnl_pct=1.0,
+            average_scaled_pnl_pct=0.5,
+            total_scaled_pnl_pct=1.0,
+            average_r_multiple=0.5,
+            first_bar_close_time="2026-01-01T00:15:00Z",
+            last_bar_close_time="2026-01-01T02:30:00Z",
+        )
+
+        self.assertEqual(list(asdict(summary).items()), list(summary.to_dict().items()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from apps.dex_bot.domain.model.types import OhlcvBar
+from research.src.adapters.csv_bar_repository import write_bars
+from research.src.app.backtest_usecase import (
+    BacktestInput,
+    run_backtest_batch,
+    run_backtest_usecase,
+)
+from research.src.infra.research_config import load_bot_config
+
+_CONFIG_PATH = "research/models/gmo_ema_pullback_15m_both_v0/config/current.json"
+
+
+def _build_random_walk_bars(count: int, seed: int) -> list[OhlcvBar]:
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    bars: list[OhlcvBar] = []
+    close = 20_000.0
+    for index in range(count):
+        open_ = close
+        close = open_ * (1.0 + rng.gauss(0.0, 0.004))
+        bars.append(
+            OhlcvBar(
+                open_time=start + timedelta(minutes=15 * index),
+                close_time=start + timedelta(minutes=15 * (index + 1)),
+                open=open_,
+                high=max(open_, close) * (1.0 + abs(rng.gauss(0.0, 0.002))),
+                low=min(open_, close) * (1.0 - abs(rng.gauss(0.0, 0.002))),
+                close=close,
+                volume=1_000.0,
+            )
+        )
+    return bars
+
+
+class RunBacktestBatchTest(unittest.TestCase):
+    def test_parallel_batch_matches_single_runs_in_input_order(self) -> None:
+        base_config = load_bot_config(_CONFIG_PATH)
+        wide_config = load_bot_config(_CONFIG_PATH)
+        wide_config["exit"]["take_profit_r_multiple"] = 3.0
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            first_path = str(Path(tmp_dir) / "first.parquet")
+            second_path = str(Path(tmp_dir) / "second.csv")
+            write_bars(first_path, _build_random_walk_bars(800, seed=1))
+            write_bars(second_path, _build_random_walk_bars(600, seed=2))
+            inputs = [
+                BacktestInput(config=base_config, bars_path=first_path),
+                BacktestInput(config=wide_config, bars_path=first_path, output_path=str(Path(tmp_dir) / "wide.json")),
+                BacktestInput(config=base_config, bars_path=second_path),
+            ]
+
+            expected = [run_backtest_usecase(input_data).to_dict() for input_data in inputs]
+            sequential = run_backtest_batch(inputs)
+            parallel = run_backtest_batch(inputs, workers=2)
+            self.assertTrue((Path(tmp_dir) / "wide.json").exists())
+
+        self.assertEqual(expected, [report.to_dict() for report in sequential])
+        self.assertEqual(expected, [report.to_dict() for report in parallel])
+
+    def test_parallel_batch_propagates_task_failure(self) -> None:
+        config = load_bot_config(_CONFIG_PATH)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            bars_path = str(Path(tmp_dir) / "bars.parquet")
+            write_bars(bars_path, _build_random_walk_bars(200, seed=4))
+            inputs = [BacktestInput(config=config, bars_path=bars_path) for _ in range(2)]
+            with patch(
+                "research.src.app.backtest_usecase.run_backtest",
+                side_effect=RuntimeError("engine exploded"),
+            ):
+                with self.assertRaisesRegex(RuntimeError, "engine exploded"):
+                    run_backtest_batch(inputs, workers=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import signal
+import unittest
+
+from apps.dex_bot import main as dex_main
+from apps.gmo_bot import main as gmo_main
+
+
+class BotMainSignalTest(unittest.TestCase):
+    def test_on_signal_records_signal_and_wakes_main_thread(self) -> None:
+        for module in (dex_main, gmo_main):
+            with self.subTest(module=module.__name__):
+                module._stop_event.clear()
+                module._received_signal = None
+
+                module._on_signal(signal.SIGTERM, None)
+
+                self.assertTrue(module._stop_event.is_set())
+                self.assertEqual(signal.SIGTERM, module._received_signal)
+                module._stop_event.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
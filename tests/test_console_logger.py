@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import io
+import json
+import unittest
+from unittest.mock import patch
+
+from apps.gmo_bot.infra.logging import logger as gmo_logger
+
+
+class NowIsoUtcTest(unittest.TestCase):
+    def setUp(self) -> None:
+        gmo_logger._cached_second = (-1, "")
+
+    def test_formats_utc_with_milliseconds(self) -> None:
+        # 2026-01-02T03:04:05.678Z
+        with patch.object(gmo_logger.time, "time", return_value=1767323045.678):
+            self.assertEqual("2026-01-02T03:04:05.678Z", gmo_logger._now_iso_utc())
+
+    def test_reuses_cached_second_and_refreshes_on_rollover(self) -> None:
+        with patch.object(gmo_logger.time, "time", side_effect=[1767323045.001, 1767323045.999, 1767323046.0]):
+            with patch.object(gmo_logger.time, "strftime", wraps=gmo_logger.time.strftime) as strftime:
+                self.assertEqual("2026-01-02T03:04:05.001Z", gmo_logger._now_iso_utc())
+                self.assertEqual("2026-01-02T03:04:05.999Z", gmo_logger._now_iso_utc())
+                self.assertEqual("2026-01-02T03:04:06.000Z", gmo_logger._now_iso_utc())
+        self.assertEqual(2, strftime.call_count)
+
+
+class ConsoleLoggerOutputTest(unittest.TestCase):
+    def test_json_format_writes_one_line_per_record(self) -> None:
+        logger = gmo_logger.ConsoleLogger(component="gmo", log_format="json")
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            logger.info("約定", {"pair": "SOL/JPY"})
+            logger.warn("skip")
+            gmo_logger.close_log_writer()
+
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(2, len(lines))
+        first = json.loads(lines[0])
+        self.assertEqual("INFO", first["severity"])
+        self.assertEqual("約定", first["message"])
+        self.assertEqual({"pair": "SOL/JPY"}, first["context"])
+        self.assertIn("約定", lines[0])
+        self.assertEqual("WARNING", json.loads(lines[1])["severity"])
+
+    def test_text_format_appends_context(self) -> None:
+        logger = gmo_logger.ConsoleLogger(component="gmo", log_format="text")
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            logger.error("failed", {"code": 5})
+            gmo_logger.close_log_writer()
+
+        self.assertRegex(stdout.getvalue(), r"^\S+Z \[ERROR\] \[gmo\] failed \{\"code\": 5\}\n$")
+
+    def test_close_drains_queued_lines_and_writer_restarts(self) -> None:
+        logger = gmo_logger.ConsoleLogger(component="gmo", log_format="json")
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            for index in range(50):
+                logger.info("tick", {"index": index})
+            gmo_logger.close_log_writer()
+            self.assertEqual(50, len(stdout.getvalue().splitlines()))
+
+            logger.info("after close")
+            gmo_logger.close_log_writer()
+
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(51, len(lines))
+        self.assertEqual(list(range(50)), [json.loads(line)["context"]["index"] for line in lines[:50]])
+        self.assertEqual("after close", json.loads(lines[-1])["message"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import unittest
+
+from apps.gmo_bot.infra.scheduler.cron_cycle import _next_minute_boundary
+
+
+class NextMinuteBoundaryTest(unittest.TestCase):
+    def test_rounds_up_to_next_utc_minute(self) -> None:
+        # 2026-01-02T03:04:05.678Z -> 2026-01-02T03:05:00Z
+        self.assertEqual(1767323100.0, _next_minute_boundary(1767323045.678))
+
+    def test_exact_boundary_moves_to_following_minute(self) -> None:
+        self.assertEqual(1767323160.0, _next_minute_boundary(1767323100.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import csv
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+from apps.dex_bot.domain.model.types import OhlcvBar
+from research.src.adapters.csv_bar_repository import (
+    read_bar_columns,
+    read_bars,
+    read_bars_from_csv,
+    write_bars,
+    write_bars_to_csv,
+    write_json,
+)
+
+
+def _build_bars(count: int) -> list[OhlcvBar]:
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    return [
+        OhlcvBar(
+            open_time=start + timedelta(minutes=15 * index),
+            close_time=start + timedelta(minutes=15 * (index + 1)),
+            open=100.0 + index,
+            high=101.25 + index,
+            low=99.5 + index,
+            close=100.125 + index,
+            volume=1000.0 + index,
+        )
+        for index in range(count)
+    ]
+
+
+def _read_bars_with_stdlib(path: Path) -> list[OhlcvBar]:
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        bars = [
+            OhlcvBar(
+                open_time=datetime.fromisoformat(row["open_time"].replace("Z", "+00:00")).astimezone(UTC),
+                close_time=datetime.fromisoformat(row["close_time"].replace("Z", "+00:00")).astimezone(UTC),
+                open=float(row["open"]),
+                high=float(row["high"]),
+                low=float(row["low"]),
+                close=float(row["close"]),
+                volume=float(row["volume"]),
+            )
+            for row in csv.DictReader(handle)
+        ]
+    bars.sort(key=lambda bar: bar.open_time)
+    return bars
+
+
+class CsvBarRepositoryTest(unittest.TestCase):
+    def test_round_trip_preserves_bars(self) -> None:
+        bars = _build_bars(4)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "bars.csv"
+            write_bars_to_csv(path, bars)
+            loaded = read_bars_from_csv(path)
+
+        self.assertEqual(bars, loaded)
+        self.assertIs(UTC, loaded[0].close_time.tzinfo)
+
+    def test_write_formats_rows_like_dict_writer(self) -> None:
+        bars = _build_bars(2)
+        bars[1] = OhlcvBar(
+            open_time=bars[1].open_time.replace(microsecond=250),
+            close_time=bars[1].close_time,
+            open=bars[1].open,
+            high=bars[1].high,
+            low=bars[1].low,
+            close=bars[1].close,
+            volume=bars[1].volume,
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "bars.csv"
+            write_bars_to_csv(path, bars)
+            content = path.read_bytes().decode("utf-8")
+
+        self.assertEqual(
+            "open_time,close_time,open,high,low,close,volume\r\n"
+            "2026-01-01T00:00:00Z,2026-01-01T00:15:00Z,100.000000000000,101.250000000000,"
+            "99.500000000000,100.125000000000,1000.000000000000\r\n"
+            "2026-01-01T00:15:00.000250Z,2026-01-01T00:30:00Z,101.000000000000,102.250000000000,"
+            "100.500000000000,101.125000000000,1001.000000000000\r\n",
+            content,
+        )
+
+    def test_read_sorts_by_open_time_and_normalizes_offsets(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "bars.csv"
+            path.write_text(
+                "open_time,close_time,open,high,low,close,volume\n"
+                "2026-01-01T09:15:00+09:00,2026-01-01T09:30:00+09:00,2,3,1,2.5,10\n"
+                "2026-01-01T00:00:00Z,2026-01-01T00:15:00Z,1,2,0.5,1.5,10\n",
+                encoding="utf-8",
+            )
+            loaded = read_bars_from_csv(path)
+
+        self.assertEqual(
+            [datetime(2026, 1, 1, 0, 0, tzinfo=UTC), datetime(2026, 1, 1, 0, 15, tzinfo=UTC)],
+            [bar.open_time for bar in loaded],
+        )
+        self.assertEqual([1.0, 2.0], [bar.open for bar in loaded])
+
+    def test_read_rejects_empty_numeric_cell(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "bars.csv"
+            path.write_text(
+                "open_time,close_time,open,high,low,close,volume\n"
+                "2026-01-01T00:00:00Z,2026-01-01T00:15:00Z,1,2,0.5,1.5,10\n"
+                "2026-01-01T00:15:00Z,2026-01-01T00:30:00Z,1,,0.5,1.5,10\n",
+                encoding="utf-8",
+            )
+            with self.assertRaisesRegex(ValueError, "index 1"):
+                read_bars_from_csv(path)
+
+    def test_read_rejects_header_only_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "bars.csv"
+            path.write_text("open_time,close_time,open,high,low,close,volume\n", encoding="utf-8")
+            with self.assertRaisesRegex(ValueError, "no rows"):
+                read_bars_from_csv(path)
+
+    def test_parquet_round_trip_matches_csv(self) -> None:
+        bars = _build_bars(4)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            parquet_path = Path(tmp_dir) / "bars.parquet"
+            csv_path = Path(tmp_dir) / "bars.csv"
+            write_bars(parquet_path, bars)
+            write_bars(csv_path, bars)
+            from_parquet = read_bars(parquet_path)
+            from_csv = read_bars(csv_path)
+            self.assertEqual("PAR1", parquet_path.read_bytes()[:4].decode("ascii"))
+
+        self.assertEqual(bars, from_parquet)
+        self.assertEqual(from_csv, from_parquet)
+        self.assertIs(UTC, from_parquet[0].open_time.tzinfo)
+
+    def test_read_bars_missing_parquet_raises(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with self.assertRaises(FileNotFoundError):
+                read_bars(Path(tmp_dir) / "missing.parquet")
+
+    def test_read_bar_columns_loads_sorted_numpy_columns(self) -> None:
+        bars = _build_bars(3)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "bars.parquet"
+            write_bars(path, list(reversed(bars)))
+            columns = read_bar_columns(path)
+
+        self.assertEqual(np.dtype("datetime64[us]"), columns.close_time.dtype)
+        self.assertEqual(np.dtype(np.float64), columns.high.dtype)
+        self.assertEqual([101.25, 102.25, 103.25], columns.high.tolist())
+        self.assertEqual(bars, columns.to_bars())
+
+    def test_columnar_reader_matches_stdlib_parsing(self) -> None:
+        rng = random.Random(7)
+        start = datetime(2026, 1, 1, tzinfo=UTC)
+        lines = ["open_time,close_time,open,high,low,close,volume"]
+        for index in rng.sample(range(500), 500):
+            open_time = start + timedelta(minutes=15 * index)
+            prices = [f"{rng.uniform(10, 30000):.12f}" for _ in range(5)]
+            lines.append(
+                f"{open_time.isoformat().replace('+00:00', 'Z')},"
+                f"{(open_time + timedelta(minutes=15)).isoformat()},"
+                + ",".join(prices)
+            )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "bars.csv"
+            path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            expected = _read_bars_with_stdlib(path)
+            loaded = read_bars_from_csv(path)
+
+        self.assertEqual(expected, loaded)
+
+
+class WriteJsonTest(unittest.TestCase):
+    def test_writes_indented_utf8_document(self) -> None:
+        payload = {
+            "summary": {"total_pnl_pct": -1.234567, "closed_trades": 3, "note": "損切り"},
+            "trades": [{"exit_reason": "TAKE_PROFIT", "r_multiple": 2.0}, {"exit_time": None}],
+            "empty": {},
+        }
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "nested" / "report.json"
+            write_json(path, payload)
+            content = path.read_text(encoding="utf-8")
+
+        self.assertEqual(json.dumps(payload, ensure_ascii=False, indent=2), content)
+
+    def test_writes_non_finite_floats_and_numpy_scalars(self) -> None:
+        payload = {"sharpe": float("nan"), "max_r": float("inf"), "pnl": np.float64(1.5), "big": 2**70}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "report.json"
+            write_json(path, payload)
+            content = path.read_text(encoding="utf-8")
+
+        self.assertIn('"sharpe": NaN', content)
+        self.assertIn('"max_r": Infinity', content)
+        self.assertEqual({"pnl": 1.5, "big": 2**70}, {key: json.loads(content)[key] for key in ("pnl", "big")})
+
+
+if __name__ == "__main__":
+    unittest.main()
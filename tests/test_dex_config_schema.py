@@ -3,7 +3,7 @@ from __future__ import annotations
 import unittest
 from copy import deepcopy
 
-from apps.dex_bot.infra.config.schema import parse_config
+from apps.dex_bot.infra.config.schema import _require, parse_config
 
 
 def _build_base_config() -> dict:
@@ -71,5 +71,26 @@ class DexConfigSchemaVariantIdTest(unittest.TestCase):
             parse_config(config)
 
 
+class DexConfigSchemaRequireTest(unittest.TestCase):
+    def test_callable_message_is_only_evaluated_on_failure(self) -> None:
+        calls: list[int] = []
+
+        def message() -> str:
+            calls.append(1)
+            return "formatted failure"
+
+        _require(True, message)
+        self.assertEqual([], calls)
+        with self.assertRaisesRegex(ValueError, "formatted failure"):
+            _require(False, message)
+        self.assertEqual([1], calls)
+
+    def test_prefixed_message_is_formatted_on_failure(self) -> None:
+        config = deepcopy(_build_base_config())
+        config["risk"]["max_trades_per_day"] = 0
+        with self.assertRaisesRegex(ValueError, "risk.max_trades_per_day must be positive int"):
+            parse_config(config)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -7,6 +7,7 @@ from apps.dex_bot.adapters.persistence.firestore_repo import (
     FirestoreRepository,
     _build_skip_run_doc_id,
     _extract_trade_date_from_trade_id,
+    sanitize_firestore_value,
 )
 from apps.dex_bot.domain.model.types import BotConfig
 
@@ -444,5 +445,17 @@ class FirestoreRepositoryDailyBalanceTest(unittest.TestCase):
         self.assertEqual("2026-05-05", records[-1]["snapshot_date_jst"])
 
 
+class SanitizeFirestoreValueTest(unittest.TestCase):
+    def test_drops_none_at_every_depth_and_returns_fresh_containers(self) -> None:
+        nested = {"keep": 1, "drop": None}
+        payload = {"a": None, "b": "x", "c": [nested, None, 2], "d": {"e": None, "f": [1, {"g": None}]}}
+
+        sanitized = sanitize_firestore_value(payload)
+
+        self.assertEqual({"b": "x", "c": [{"keep": 1}, None, 2], "d": {"f": [1, {}]}}, sanitized)
+        self.assertIsNot(payload["c"], sanitized["c"])
+        self.assertEqual({"keep": 1, "drop": None}, nested)
+
+
 if __name__ == "__main__":
     unittest.main()
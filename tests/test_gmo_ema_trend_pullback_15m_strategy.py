@@ -329,6 +329,43 @@ class GmoEmaTrendPullback15mStrategyTest(unittest.TestCase):
         self.assertEqual("NO_SIGNAL", decision.type)
         self.assertEqual("LONG_UPPER_CLOSE_DRIFT_TOO_NEGATIVE", decision.reason)
 
+    def test_upper_closes_are_built_once_and_shared_by_trend_and_regime_checks(self) -> None:
+        short_context = EmaMarketContext(
+            closes=[101.5, 101.2, 100.8, 100.5, 100.2, 100.0, 99.8],
+            highs=[102.0, 101.7, 101.3, 100.9, 100.6, 100.3, 100.1],
+            lows=[101.0, 100.8, 100.4, 100.1, 99.9, 99.7, 99.5],
+            ema_fast_by_bar=[101.3, 101.0, 100.7, 100.4, 100.2, 100.1, 100.0],
+            ema_fast=100.0,
+            ema_slow=101.0,
+            entry_price=99.6,
+            previous_close=100.0,
+            previous_ema_fast=100.1,
+        )
+        strategy = dict(self.strategy)
+        strategy["short_upper_fast_slope_max_pct"] = 0.1
+        module = "apps.gmo_bot.domain.strategy.models.ema_trend_pullback_15m_v0"
+        with (
+            patch(f"{module}.calculate_minimum_bars", return_value=1),
+            patch(f"{module}._build_upper_timeframe_closes", return_value=[100.0, 99.0, 98.0]) as build_closes,
+            patch(f"{module}._evaluate_upper_timeframe_trend", return_value=("DOWN", 97.0, 100.0, 80)) as trend,
+            patch(f"{module}._calculate_upper_trend_regime_metrics", return_value=(0.12, 0.0)) as regime,
+            patch(f"{module}.build_ema_market_context", return_value=short_context),
+            patch(f"{module}.atr_series", return_value=[0.2]),
+            patch(f"{module}.rsi_series", return_value=[45.0]),
+        ):
+            decision = evaluate_ema_trend_pullback_15m_v0(
+                bars=self.bars,
+                strategy=strategy,
+                risk=self.risk,
+                exit=self.exit,
+                execution=self.execution,
+            )
+
+        self.assertEqual("SHORT_UPPER_FAST_SLOPE_TOO_POSITIVE", decision.reason)
+        build_closes.assert_called_once()
+        self.assertIs(build_closes.return_value, trend.call_args.args[0])
+        self.assertIs(build_closes.return_value, regime.call_args.args[0])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,7 +3,7 @@ from __future__ import annotations
 import unittest
 from typing import Any, cast
 
-from apps.gmo_bot.adapters.persistence.firestore_repo import FirestoreRepository
+from apps.gmo_bot.adapters.persistence.firestore_repo import FirestoreRepository, sanitize_firestore_value
 
 
 class _SetOnlyDocument:
@@ -202,5 +202,17 @@ class GmoFirestoreRepositoryDailyBalanceTest(unittest.TestCase):
         self.assertEqual(123456.0, payload["balance_jpy"])
 
 
+class SanitizeFirestoreValueTest(unittest.TestCase):
+    def test_drops_none_at_every_depth_and_returns_fresh_containers(self) -> None:
+        nested = {"keep": 1, "drop": None}
+        payload = {"a": None, "b": "x", "c": [nested, None, 2], "d": {"e": None, "f": [1, {"g": None}]}}
+
+        sanitized = sanitize_firestore_value(payload)
+
+        self.assertEqual({"b": "x", "c": [{"keep": 1}, None, 2], "d": {"f": [1, {}]}}, sanitized)
+        self.assertIsNot(payload["c"], sanitized["c"])
+        self.assertEqual({"keep": 1, "drop": None}, nested)
+
+
 if __name__ == "__main__":
     unittest.main()
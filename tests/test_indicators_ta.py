@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import math
+import unittest
+
+from shared.indicators.ta import ema_series
+
+
+class EmaSeriesTest(unittest.TestCase):
+    def test_seeds_with_sma_and_applies_recurrence(self) -> None:
+        closes = [10.0, 11.0, 12.0, 13.0, 12.5, 14.0]
+
+        values = ema_series(closes, 3)
+
+        k = 2 / (3 + 1)
+        expected = [11.0]
+        for close in closes[3:]:
+            expected.append(close * k + expected[-1] * (1 - k))
+        self.assertEqual(4, len(values))
+        for actual, reference in zip(values, expected):
+            self.assertTrue(math.isclose(actual, reference, rel_tol=1e-12))
+
+    def test_returns_empty_for_short_or_non_finite_input(self) -> None:
+        self.assertEqual([], ema_series([1.0, 2.0], 3))
+        self.assertEqual([], ema_series([1.0, float("nan"), 2.0, 3.0], 2))
+        self.assertEqual([], ema_series([1.0, 2.0, 3.0], 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import json
+import os
+from pathlib import Path
+import tempfile
 import unittest
 
 from apps.dex_bot.adapters.market_data.ohlcv_provider import OhlcvProvider as DexOhlcvProvider
@@ -29,6 +33,26 @@ class ResearchConfigTest(unittest.TestCase):
         self.assertEqual(0.05, config["strategy"]["short_upper_trend_min_gap_pct"])
         self.assertEqual(68.0, config["strategy"]["rsi_long_upper_bound"])
 
+    def test_load_bot_config_returns_independent_copies_and_rereads_on_change(self) -> None:
+        source = Path("research/models/ema_pullback_15m_both_v0/config/current.json")
+        raw = json.loads(source.read_text(encoding="utf-8"))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "config.json"
+            path.write_text(json.dumps(raw), encoding="utf-8")
+
+            first = load_bot_config(path)
+            first["exit"]["take_profit_r_multiple"] = 99.0
+            second = load_bot_config(path)
+            self.assertNotEqual(99.0, second["exit"]["take_profit_r_multiple"])
+
+            raw["exit"]["take_profit_r_multiple"] = second["exit"]["take_profit_r_multiple"] + 0.5
+            path.write_text(json.dumps(raw), encoding="utf-8")
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            reloaded = load_bot_config(path)
+
+        self.assertEqual(raw["exit"]["take_profit_r_multiple"], reloaded["exit"]["take_profit_r_multiple"])
+
 
 class ResearchFetchOhlcvProviderTest(unittest.TestCase):
     def test_build_provider_returns_dex_provider_for_solusdc(self) -> None:
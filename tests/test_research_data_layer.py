@@ -4,7 +4,10 @@ from datetime import UTC, datetime, timedelta
 import tempfile
 import unittest
 
+import numpy as np
+
 from apps.dex_bot.domain.model.types import OhlcvBar
+from research.src.data.bar_columns import OhlcvColumns
 from research.src.data.market_dataset import MarketDataset, compute_data_hash
 from research.src.data.partitioned_cache import (
     PartitionedOhlcvCache,
@@ -72,6 +75,20 @@ class ResearchDataHelpersTest(unittest.TestCase):
         self.assertEqual(1, len(gaps))
         self.assertEqual(2, gaps[0]["missing_bars"])
 
+    def test_ohlcv_columns_mirror_bars_and_slice_as_views(self) -> None:
+        bars = _build_bars(6)
+        columns = OhlcvColumns.from_bars(bars)
+
+        self.assertEqual(6, len(columns))
+        self.assertEqual([bar.low for bar in bars], columns.low.tolist())
+        self.assertEqual(np.datetime64("2026-01-01T00:15:00", "us"), columns.close_time[0])
+        self.assertEqual([15.0] * 5, (np.diff(columns.close_time) / np.timedelta64(1, "m")).tolist())
+
+        window = columns.slice(2, 5)
+        self.assertEqual(3, len(window))
+        self.assertTrue(np.shares_memory(window.close, columns.close))
+        self.assertEqual([bar.close for bar in bars[2:5]], window.close.tolist())
+
 
 @unittest.skipUnless(is_pyarrow_available(), "pyarrow is not installed")
 class PartitionedOhlcvCacheTest(unittest.TestCase):
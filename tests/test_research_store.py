@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import subprocess
 import tempfile
 import unittest
+from unittest.mock import patch
 
-from research.src.store.lineage import build_run_id
+from research.src.store.lineage import build_run_id, capture_git_dirty
 from research.src.store.trial_store import TrialStore, flatten_trial_row, unflatten_trial_row
 from research.src.store.views import diff, marginal_by_axis, rank
 
@@ -110,6 +112,18 @@ class ResearchStoreTest(unittest.TestCase):
         self.assertIn("my-spec", run_id)
         self.assertTrue(run_id.endswith("abcdef0"))
 
+    def test_capture_git_dirty_reports_changes_under_paths(self) -> None:
+        def status(stdout: str) -> subprocess.CompletedProcess[str]:
+            return subprocess.CompletedProcess(args=[], returncode=0, stdout=stdout)
+
+        with patch("research.src.store.lineage.subprocess.run", return_value=status(" M apps/x.py\n")) as run:
+            self.assertTrue(capture_git_dirty(":/apps"))
+        self.assertEqual(":/apps", run.call_args.args[0][-1])
+        with patch("research.src.store.lineage.subprocess.run", return_value=status("")):
+            self.assertFalse(capture_git_dirty(":/apps"))
+        with patch("research.src.store.lineage.subprocess.run", side_effect=FileNotFoundError("git")):
+            self.assertIsNone(capture_git_dirty(":/apps"))
+
 
 if __name__ == "__main__":
     unittest.main()
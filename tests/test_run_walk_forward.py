@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from research.scripts.run_walk_forward import _backtest_summary, _infer_bar_minutes
+
+
+class InferBarMinutesTest(unittest.TestCase):
+    def test_picks_most_common_positive_interval(self) -> None:
+        self.assertEqual(15, _infer_bar_minutes(np.array([15, 0, 15, 30, -15, 15], dtype=np.int64)))
+
+    def test_tie_is_broken_by_first_occurrence(self) -> None:
+        self.assertEqual(30, _infer_bar_minutes(np.array([30, 15, 15, 30], dtype=np.int64)))
+        self.assertEqual(15, _infer_bar_minutes(np.array([15, 30, 30, 15], dtype=np.int64)))
+
+
+
+class BacktestSummaryCacheTest(unittest.TestCase):
+    def test_truncated_cache_entry_is_recomputed_and_replaced(self) -> None:
+        report = MagicMock()
+        report.summary.to_dict.return_value = {"closed_trades": 3}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = Path(tmp_dir) / "slice.json"
+            cache_path.write_text('{"closed_tra', encoding="utf-8")
+            with patch("research.scripts.run_walk_forward.run_backtest", return_value=report) as run:
+                self.assertEqual({"closed_trades": 3}, _backtest_summary([], MagicMock(), {}, cache_path))
+                self.assertEqual({"closed_trades": 3}, _backtest_summary([], MagicMock(), {}, cache_path))
+
+            self.assertEqual(1, run.call_count)
+            self.assertEqual({"closed_trades": 3}, json.loads(cache_path.read_text(encoding="utf-8")))
+            self.assertEqual(["slice.json"], sorted(path.name for path in Path(tmp_dir).iterdir()))
+
+
+if __name__ == "__main__":
+    unittest.main()
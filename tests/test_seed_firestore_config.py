@@ -41,6 +41,24 @@ class _FakeDocumentRef:
             return
         self._store[self._path] = dict(payload)
 
+    def collection(self, collection_name: str) -> "_FakeCollectionRef":
+        return _FakeCollectionRef(self._store, f"{self._path}/{collection_name}")
+
+
+class _FakeWriteBatch:
+    def __init__(self, firestore: "_FakeFirestore"):
+        self._firestore = firestore
+        self._writes: list[tuple[_FakeDocumentRef, dict[str, Any], bool]] = []
+
+    def set(self, reference: _FakeDocumentRef, payload: dict[str, Any], merge: bool = False) -> None:
+        self._writes.append((reference, payload, merge))
+
+    def commit(self) -> None:
+        self._firestore.commit_count += 1
+        for reference, payload, merge in self._writes:
+            reference.set(payload, merge=merge)
+        self._writes.clear()
+
 
 class _FakeCollectionRef:
     def __init__(self, store: dict[str, Any], collection_name: str):
@@ -54,10 +72,14 @@ class _FakeCollectionRef:
 class _FakeFirestore:
     def __init__(self, store: dict[str, Any]):
         self._store = store
+        self.commit_count = 0
 
     def document(self, path: str) -> _FakeDocumentRef:
         return _FakeDocumentRef(self._store, path)
 
+    def batch(self) -> _FakeWriteBatch:
+        return _FakeWriteBatch(self)
+
     def collection(self, collection_name: str) -> _FakeCollectionRef:
         return _FakeCollectionRef(self._store, collection_name)
 
@@ -109,6 +131,33 @@ class SeedGlobalControlDefaultsTest(unittest.TestCase):
         self.assertTrue(changed)
         self.assertFalse(store[self._control_doc_path()][seed_firestore_config.GLOBAL_CONTROL_PAUSE_FIELD])
 
+    def test_queues_default_on_caller_batch(self) -> None:
+        store: dict[str, Any] = {}
+        firestore = _FakeFirestore(store)
+        batch = firestore.batch()
+
+        changed = seed_firestore_config.seed_global_control_defaults(firestore, batch=batch)  # type: ignore[arg-type]
+
+        self.assertTrue(changed)
+        self.assertEqual({}, store)
+        batch.commit()
+        self.assertFalse(store[self._control_doc_path()][seed_firestore_config.GLOBAL_CONTROL_PAUSE_FIELD])
+
+    def test_existing_pause_flag_is_not_queued_on_batch(self) -> None:
+        store: dict[str, Any] = {
+            self._control_doc_path(): {
+                seed_firestore_config.GLOBAL_CONTROL_PAUSE_FIELD: True,
+            }
+        }
+        firestore = _FakeFirestore(store)
+        batch = firestore.batch()
+
+        changed = seed_firestore_config.seed_global_control_defaults(firestore, batch=batch)  # type: ignore[arg-type]
+        batch.commit()
+
+        self.assertFalse(changed)
+        self.assertTrue(store[self._control_doc_path()][seed_firestore_config.GLOBAL_CONTROL_PAUSE_FIELD])
+
     def test_model_doc_payload_keeps_direction_for_15m_strategy(self) -> None:
         config = seed_firestore_config._default_long_15m_config("LIVE")
         payload = seed_firestore_config._build_model_doc_payload("ema_pullback_15m_both_v0", config)
@@ -120,5 +169,35 @@ class SeedGlobalControlDefaultsTest(unittest.TestCase):
         self.assertEqual("LONG", payload["direction"])
 
 
+class SeedModelConfigTest(unittest.TestCase):
+    def test_writes_model_and_config_docs_in_one_commit(self) -> None:
+        store: dict[str, Any] = {"models/ema_pullback_2h_long_v0": {"wallet_key_path": "keep"}}
+        firestore = _FakeFirestore(store)
+        config = seed_firestore_config._default_long_config("PAPER")
+
+        seed_firestore_config.seed_model_config(firestore, "ema_pullback_2h_long_v0", config)  # type: ignore[arg-type]
+
+        self.assertEqual(1, firestore.commit_count)
+        model_doc = store["models/ema_pullback_2h_long_v0"]
+        self.assertEqual("keep", model_doc["wallet_key_path"])
+        self.assertEqual("PAPER", model_doc["mode"])
+        config_doc = store["models/ema_pullback_2h_long_v0/config/current"]
+        self.assertNotIn("mode", config_doc["execution"])
+        self.assertEqual(config["strategy"], config_doc["strategy"])
+
+    def test_shared_batch_defers_writes_until_caller_commits(self) -> None:
+        store: dict[str, Any] = {}
+        firestore = _FakeFirestore(store)
+        batch = firestore.batch()
+
+        for model_id, config in seed_firestore_config.build_default_model_configs("LIVE").items():
+            seed_firestore_config.seed_model_config(firestore, model_id, config, batch=batch)  # type: ignore[arg-type]
+        self.assertEqual({}, store)
+        batch.commit()
+
+        self.assertEqual(1, firestore.commit_count)
+        self.assertEqual(6, len(store))
+
+
 if __name__ == "__main__":
     unittest.main()
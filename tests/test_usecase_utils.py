@@ -25,6 +25,11 @@ class UsecaseUtilsSummaryTest(unittest.TestCase):
             summarized,
         )
 
+    def test_summarize_error_for_log_extracts_json_quoted_message(self) -> None:
+        message = 'RPC error: {"code": -32002, "message": "Blockhash not found"}'
+
+        self.assertEqual("Blockhash not found", summarize_error_for_log(message))
+
     def test_summarize_error_for_log_truncates_long_message(self) -> None:
         long_message = "x" * 500
 
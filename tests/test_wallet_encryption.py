@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import base64
+from hashlib import scrypt
+import json
+import os
+from pathlib import Path
+import runpy
+import tempfile
+import unittest
+
+import base58
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from solders.keypair import Keypair
+
+from apps.dex_bot.adapters.execution.solana_sender import _decrypt_secret_key
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+MODULE = runpy.run_path(str(PROJECT_ROOT / "scripts" / "encrypt-wallet.py"))
+
+SECRET_KEY = list(range(64))
+
+
+def _legacy_wallet_payload(passphrase: str) -> dict[str, str | int]:
+    salt = os.urandom(16)
+    iv = os.urandom(12)
+    key = scrypt(passphrase.encode("utf-8"), salt=salt, n=16384, r=8, p=1, dklen=32)
+    encrypted = AESGCM(key).encrypt(iv, json.dumps(SECRET_KEY).encode("utf-8"), None)
+    return {
+        "version": 1,
+        "algorithm": "aes-256-gcm",
+        "kdf": "scrypt",
+        "salt_base64": base64.b64encode(salt).decode("utf-8"),
+        "iv_base64": base64.b64encode(iv).decode("utf-8"),
+        "auth_tag_base64": base64.b64encode(encrypted[-16:]).decode("utf-8"),
+        "ciphertext_base64": base64.b64encode(encrypted[:-16]).decode("utf-8"),
+    }
+
+
+class WalletEncryptionTest(unittest.TestCase):
+    def test_encrypted_wallet_records_kdf_params_and_decrypts(self) -> None:
+        payload = MODULE["encrypt_secret_key"](SECRET_KEY, "passphrase")
+        self.assertEqual(MODULE["SCRYPT_N"], payload["scrypt_n"])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "wallet.enc.json"
+            path.write_text(json.dumps(payload), encoding="utf-8")
+            self.assertEqual(bytes(SECRET_KEY), _decrypt_secret_key(str(path), "passphrase"))
+
+    def test_legacy_wallet_without_kdf_params_still_decrypts(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "wallet.enc.json"
+            path.write_text(json.dumps(_legacy_wallet_payload("passphrase")), encoding="utf-8")
+            self.assertEqual(bytes(SECRET_KEY), _decrypt_secret_key(str(path), "passphrase"))
+
+    def test_base58_seed_expands_to_solana_keypair_bytes(self) -> None:
+        seed = bytes(range(100, 132))
+
+        secret_key = MODULE["load_secret_key_from_base58"](base58.b58encode(seed).decode("ascii"))
+
+        self.assertEqual(list(bytes(Keypair.from_seed(seed))), secret_key)
+
+    def test_rejects_invalid_kdf_params(self) -> None:
+        cases = [
+            ("scrypt_n", 2**30, "scrypt_n must be <="),
+            ("scrypt_n", 3000, "power of two"),
+            ("scrypt_n", 1, "power of two"),
+            ("scrypt_r", 2**20, "scrypt_r must be <="),
+            ("scrypt_p", 2**20, "scrypt_p must be <="),
+        ]
+        for name, value, message in cases:
+            with self.subTest(name=name, value=value):
+                payload = _legacy_wallet_payload("passphrase")
+                payload[name] = value
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    path = Path(tmp_dir) / "wallet.enc.json"
+                    path.write_text(json.dumps(payload), encoding="utf-8")
+                    with self.assertRaisesRegex(ValueError, message):
+                        _decrypt_secret_key(str(path), "passphrase")
+
+    def test_rejects_kdf_params_exceeding_memory_cap(self) -> None:
+        payload = _legacy_wallet_payload("passphrase")
+        payload.update(scrypt_n=2**20, scrypt_r=16)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "wallet.enc.json"
+            path.write_text(json.dumps(payload), encoding="utf-8")
+            with self.assertRaisesRegex(ValueError, "scrypt memory"):
+                _decrypt_secret_key(str(path), "passphrase")
+
+
+if __name__ == "__main__":
+    unittest.main()